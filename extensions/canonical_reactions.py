@@ -5,7 +5,7 @@ between on-target and off-target polymers in a TBN system.
 """
 
 from pathlib import Path
-from typing import List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 import numpy as np
 
@@ -15,6 +15,35 @@ from tbnexplorer2.normaliz import NormalizRunner
 from tbnexplorer2.tbnpolys_io import TbnpolysParser
 
 
+def polymer_key(polymer: np.ndarray) -> bytes:
+    """
+    Get a hashable key for a monomer count vector, independent of its integer dtype.
+
+    Args:
+        polymer: Monomer count vector
+
+    Returns:
+        Raw bytes of the counts as int64
+    """
+    return np.asarray(polymer, dtype=np.int64).tobytes()
+
+
+def polymer_basis_index(polymer_basis: List[np.ndarray]) -> Dict[bytes, int]:
+    """
+    Map each polymer in a basis to its index, for constant-time lookups.
+
+    Args:
+        polymer_basis: List of all polymers in the basis (as monomer count vectors)
+
+    Returns:
+        Dictionary from polymer_key to the index of the first matching polymer
+    """
+    basis_indices = {}
+    for i, polymer in enumerate(polymer_basis):
+        basis_indices.setdefault(polymer_key(polymer), i)
+    return basis_indices
+
+
 class Reaction:
     """Represents a reaction between polymers."""
 
@@ -54,10 +83,23 @@ class Reaction:
         Returns:
             True if sum of reactant multiplicities equals sum of product multiplicities
         """
-        reactants, products = self.get_reactants_and_products()
-        reactant_count = sum(mult for _, mult in reactants)
-        product_count = sum(mult for _, mult in products)
-        return reactant_count == product_count
+        # Reactant and product multiplicities cancel exactly when the vector sums to zero;
+        # ndarray.sum accumulates small integer dtypes (e.g. int8) at platform int width
+        return int(self.vector.sum()) == 0
+
+    @staticmethod
+    def are_balanced(vectors: np.ndarray) -> np.ndarray:
+        """
+        Check a batch of reaction vectors for balance in one vectorized pass.
+
+        Args:
+            vectors: 2-D array with one reaction vector per row
+
+        Returns:
+            Boolean array, True where a row's reactant and product multiplicities are equal
+        """
+        # Same check as is_balanced, row by row
+        return np.asarray(vectors).sum(axis=1) == 0
 
     def __str__(self) -> str:
         """String representation of the reaction."""
@@ -131,38 +173,35 @@ class CanonicalReactionsComputer:
         parser = TbnpolysParser(self.tbn)
         on_target_polymers_raw = parser.parse_file(tbnpolys_file)
 
-        # Convert to monomer count vectors
+        # Convert to monomer count vectors. The parser resolves monomers to the
+        # TBN's own Monomer objects, so they can be indexed by identity.
+        monomer_indices = {id(monomer): i for i, monomer in enumerate(self.tbn.monomers)}
         on_target_polymers = []
         for polymer_raw in on_target_polymers_raw:
             # Create monomer count vector
             counts = np.zeros(len(self.tbn.monomers), dtype=int)
             for multiplicity, monomer in polymer_raw:
-                # Find monomer index
-                monomer_idx = self.tbn.monomers.index(monomer)
-                counts[monomer_idx] += multiplicity
+                counts[monomer_indices[id(monomer)]] += multiplicity
             on_target_polymers.append(counts)
 
         # Find indices of on-target polymers in the polymer basis
+        basis_indices = polymer_basis_index(polymer_basis)
         on_target_indices = set()
         for on_target in on_target_polymers:
-            found = False
-            for i, polymer in enumerate(polymer_basis):
-                if np.array_equal(on_target, polymer):
-                    on_target_indices.add(i)
-                    found = True
-                    break
-
-            if not found:
+            index = basis_indices.get(polymer_key(on_target))
+            if index is None:
                 raise ValueError(f"On-target polymer {on_target} not found in polymer basis")
+            on_target_indices.add(index)
 
         return on_target_indices
 
-    def setup_matrices(self, polymer_basis: List[np.ndarray], on_target_indices: Set[int]):
+    def setup_matrices(self, polymer_basis: Union[List[np.ndarray], np.ndarray], on_target_indices: Set[int]):
         """
         Set up B and S matrices for the canonical reactions computation.
 
         Args:
-            polymer_basis: List of all polymers (as monomer count vectors)
+            polymer_basis: All polymers as monomer count vectors, either a list of
+                vectors or a 2-D array of shape (n_polymers, n_monomers)
             on_target_indices: Set of indices of on-target polymers
         """
         self.polymers = polymer_basis
@@ -174,16 +213,18 @@ class CanonicalReactionsComputer:
         n_off_target = len(self.off_target_indices)
 
         # B matrix: B[i,p] = count of monomer i in polymer p
-        # Shape: (n_monomers, n_polymers)
-        self.B_matrix = np.zeros((n_monomers, n_polymers), dtype=int)
-        for p, polymer in enumerate(polymer_basis):
-            self.B_matrix[:, p] = polymer
+        # Shape: (n_monomers, n_polymers). The transpose of the (n_polymers, n_monomers)
+        # count matrix, which keeps each polymer's column contiguous in memory. Signed integer
+        # counts (e.g. int8) keep their dtype; B is only copied into int solver matrices
+        counts = np.asarray(polymer_basis)
+        if counts.dtype.kind != "i":
+            counts = counts.astype(int)
+        self.B_matrix = counts.reshape(n_polymers, n_monomers).T
 
         # S matrix: Selects off-target polymers
         # Shape: (n_off_target, n_polymers)
         self.S_matrix = np.zeros((n_off_target, n_polymers), dtype=int)
-        for i, p in enumerate(sorted(self.off_target_indices)):
-            self.S_matrix[i, p] = 1
+        self.S_matrix[np.arange(n_off_target), sorted(self.off_target_indices)] = 1
 
     def compute_irreducible_canonical_reactions(self) -> List[Reaction]:
         """
@@ -498,13 +539,15 @@ class CanonicalReactionsComputer:
         Returns:
             First violating reaction if found, None otherwise
         """
-        for reaction in reactions:
-            reactants, products = reaction.get_reactants_and_products()
+        if not reactions:
+            return None
 
-            # Check if this reaction is entirely over on-target polymers
-            all_on_target = all(idx in self.on_target_indices for idx, _ in reactants + products)
+        vectors = np.stack([reaction.vector for reaction in reactions])
 
-            if all_on_target and not reaction.is_balanced():
-                return reaction
+        # A reaction is entirely over on-target polymers if it has no off-target entries
+        off_target = np.ones(vectors.shape[1], dtype=bool)
+        off_target[list(self.on_target_indices)] = False
+        all_on_target = ~np.any(vectors[:, off_target] != 0, axis=1)
 
-        return None
+        violating = np.flatnonzero(all_on_target & ~Reaction.are_balanced(vectors))
+        return reactions[violating[0]] if violating.size else None
@@ -28,12 +28,17 @@ from tbnexplorer2.normaliz import NormalizRunner
 from tbnexplorer2.parser import TBNParser
 from tbnexplorer2.polymer_basis import PolymerBasisComputer
 
-from .canonical_reactions import CanonicalReactionsComputer
+from .canonical_reactions import CanonicalReactionsComputer, polymer_basis_index, polymer_key
 from .ibot import IBOTAlgorithm
 
 
-def main():
-    """Main entry point for tbnexplorer2-ibot CLI."""
+def main(argv=None):
+    """
+    Main entry point for tbnexplorer2-ibot CLI.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+    """
     parser = argparse.ArgumentParser(description="Run IBOT algorithm for iterative balancing of off-target polymers")
 
     # Required arguments
@@ -104,7 +109,7 @@ def main():
     if argcomplete:
         argcomplete.autocomplete(parser)
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Validate input files
     tbn_path = Path(args.tbn_file)
@@ -189,24 +194,21 @@ def main():
             target_polymers_raw = parser.parse_file(args.upper_bound_on_polymers)
 
             # Convert to polymer indices
+            monomer_indices = {id(monomer): i for i, monomer in enumerate(tbn.monomers)}
+            basis_indices = polymer_basis_index(polymer_vectors)
             target_polymer_indices = set()
             for polymer_raw in target_polymers_raw:
                 # Create monomer count vector
                 counts = np.zeros(len(tbn.monomers), dtype=int)
                 for multiplicity, monomer in polymer_raw:
-                    monomer_idx = tbn.monomers.index(monomer)
-                    counts[monomer_idx] += multiplicity
+                    counts[monomer_indices[id(monomer)]] += multiplicity
 
                 # Find index in polymer basis
-                found = False
-                for i, polymer in enumerate(polymer_vectors):
-                    if np.array_equal(counts, polymer):
-                        target_polymer_indices.add(i)
-                        found = True
-                        break
-
-                if not found:
+                index = basis_indices.get(polymer_key(counts))
+                if index is None:
                     print(f"Warning: Target polymer {counts} not found in polymer basis", file=sys.stderr)
+                else:
+                    target_polymer_indices.add(index)
 
             if not target_polymer_indices:
                 print("Error: No valid target polymers found in polymer basis", file=sys.stderr)
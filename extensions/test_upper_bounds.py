@@ -5,13 +5,14 @@ This module tests the computation of upper bounds on specific off-target polymer
 concentrations using the restricted irreducible canonical reactions approach.
 """
 
-import subprocess
-import tempfile
+import contextlib
+import io
 from pathlib import Path
 
 import numpy as np
 import pytest
 
+from extensions import ibot_cli
 from extensions.canonical_reactions import CanonicalReactionsComputer
 from extensions.ibot import IBOTAlgorithm
 from tbnexplorer2.model import TBN
@@ -24,16 +25,10 @@ from tbnexplorer2.tbnpolys_io import TbnpolysParser
 class TestUpperBoundsComputation:
     """Test upper bounds computation for specific off-target polymers."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.temp_path = Path(self.temp_dir)
-
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
-
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    @pytest.fixture(autouse=True)
+    def _temp_path(self, tmp_path):
+        """Give each test its own temporary directory, cleaned up by pytest."""
+        self.temp_path = tmp_path
 
     def create_test_tbn_file(self, content: str, filename: str = "test.tbn") -> Path:
         """Create a test .tbn file with given content."""
@@ -131,25 +126,22 @@ c d
 """
         upper_bound_path = self.create_test_tbnpolys_file(upper_bound_content, "upper_bound.tbnpolys")
 
-        # Test: Cannot use with --generate-tbn
-        result = subprocess.run(
-            [
-                "python",
-                "-m",
-                "extensions.ibot_cli",
-                str(tbn_path),
-                str(on_target_path),
-                "--upper-bound-on-polymers",
-                str(upper_bound_path),
-                "--generate-tbn",
-                "100",
-                "nM",
-            ],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode != 0
-        assert "cannot be used with --generate-tbn" in result.stderr
+        # Test: Cannot use with --generate-tbn (run in-process rather than spawning the CLI)
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr), pytest.raises(SystemExit) as exc_info:
+            ibot_cli.main(
+                [
+                    str(tbn_path),
+                    str(on_target_path),
+                    "--upper-bound-on-polymers",
+                    str(upper_bound_path),
+                    "--generate-tbn",
+                    "100",
+                    "nM",
+                ]
+            )
+        assert exc_info.value.code != 0
+        assert "cannot be used with --generate-tbn" in stderr.getvalue()
 
     def test_upper_bounds_identical_to_full_ibot(self):
         """Test that using all off-target polymers gives identical results to regular IBOT.
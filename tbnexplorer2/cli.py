@@ -35,8 +35,12 @@ from .polymer_basis import PolymerBasisComputer
 from .units import get_unit_display_name
 
 
-def main():
-    """Main entry point for the CLI."""
+def _build_parser():
+    """Build the argument parser for the CLI.
+
+    Returns:
+        argparse.ArgumentParser for the tbnexplorer2 command
+    """
     parser = argparse.ArgumentParser(
         description="TBN Explorer 2 - Analyze Thermodynamics of Binding Networks",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -145,6 +149,12 @@ TBN File Format:
         help="Store copies of input files for Normaliz/4ti2 in solver-inputs directory for debugging",
     )
 
+    parser.add_argument(
+        "--basis-cache-dir",
+        metavar="DIR",
+        help="Directory in which to memoize computed polymer bases, keyed by the TBN matrix hash",
+    )
+
     parser.add_argument(
         "--temp",
         type=float,
@@ -177,12 +187,26 @@ TBN File Format:
     if argcomplete:
         nupack_arg.completer = nupack_path_completer
 
+    return parser
+
+
+def main():
+    """Main entry point for the CLI."""
+    parser = _build_parser()
+
     # Enable argcomplete if available
     if argcomplete:
         argcomplete.autocomplete(parser)
 
-    args = parser.parse_args()
+    _run(parser.parse_args())
+
+
+def _run(args):
+    """Run the polymer basis pipeline for parsed command-line arguments.
 
+    Args:
+        args: Namespace produced by the parser from _build_parser()
+    """
     # Validate input file
     if not os.path.exists(args.input_file):
         print(f"Error: Input file '{args.input_file}' not found", file=sys.stderr)
@@ -271,7 +295,11 @@ TBN File Format:
 
         # Try to load cached polymer basis first
         computer = PolymerBasisComputer(
-            tbn, solver_runner, store_solver_inputs=args.store_solver_inputs, input_base_name=base_name
+            tbn,
+            solver_runner,
+            store_solver_inputs=args.store_solver_inputs,
+            input_base_name=base_name,
+            basis_cache_dir=args.basis_cache_dir,
         )
         polymers = computer.load_cached_polymer_basis(polymat_file)
 
@@ -5,7 +5,7 @@ Integration with COFFEE (Computation Of Free-Energy Equilibria) tool.
 import os
 import subprocess
 import tempfile
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, List, Optional, TextIO
 
 import numpy as np
 
@@ -124,12 +124,23 @@ class COFFEERunner:
             temperature: Temperature in Celsius (default: 37.0)
         """
         with open(filepath, "w") as f:
-            for polymer in polymers:
-                # Write monomer counts
-                counts_str = " ".join(str(int(c)) for c in polymer.monomer_counts)
-                # Compute and write free energy
-                free_energy = polymer.compute_free_energy(deltaG, temperature)
-                f.write(f"{counts_str} {free_energy}\n")
+            self._write_cfe_stream(polymers, f, deltaG, temperature)
+
+    def _write_cfe_stream(
+        self, polymers: List["Polymer"], f: TextIO, deltaG: Optional[List[float]] = None, temperature: float = 37.0
+    ):
+        """Write CFE content to an open text stream (see _write_cfe_file)."""
+        if not polymers:
+            return
+
+        # Convert counts and free energies to Python numbers in bulk, then format
+        # every row with one precomputed format string and write them in one call
+        counts = np.stack([polymer.monomer_counts for polymer in polymers]).astype(np.int64, copy=False)
+        free_energies = np.asarray(
+            [polymer.compute_free_energy(deltaG, temperature) for polymer in polymers], dtype=float
+        ).tolist()
+        row_format = "%d " * counts.shape[1] + "%s\n"
+        f.write("".join(row_format % (*row, fe) for row, fe in zip(counts.tolist(), free_energies)))
 
     def _write_con_file(self, tbn: TBN, filepath: str):
         """
@@ -139,9 +150,13 @@ class COFFEERunner:
         COFFEE expects concentrations in Molar units.
         """
         with open(filepath, "w") as f:
-            for conc in tbn.concentrations:
-                # tbn.concentrations already returns values in Molar units
-                f.write(f"{conc}\n")
+            self._write_con_stream(tbn, f)
+
+    def _write_con_stream(self, tbn: TBN, f: TextIO):
+        """Write CON content to an open text stream (see _write_con_file)."""
+        for conc in tbn.concentrations:
+            # tbn.concentrations already returns values in Molar units
+            f.write(f"{conc}\n")
 
     def _parse_coffee_output(self, filepath: str) -> np.ndarray:
         """
@@ -151,18 +166,25 @@ class COFFEERunner:
             Array of concentrations
         """
         with open(filepath) as f:
-            content = f.read().strip()
+            return self._parse_coffee_output_stream(f)
 
-        # Parse space-separated values (may be in scientific notation)
-        values = content.split()
-        concentrations = []
-
-        for val_str in values:
-            try:
-                # Handle scientific notation like "4.47e-53" or "0.00e0"
-                conc = float(val_str)
-                concentrations.append(conc)
-            except ValueError as e:
-                raise RuntimeError(f"Cannot parse concentration value: {val_str}") from e
+    def _parse_coffee_output_stream(self, f: TextIO) -> np.ndarray:
+        """
+        Parse COFFEE output from an open text stream.
 
-        return np.array(concentrations)
+        Returns:
+            Array of concentrations
+        """
+        # Parse whitespace-separated values (may be in scientific notation like
+        # "4.47e-53" or "0.00e0") in a single conversion
+        values = f.read().split()
+        try:
+            return np.array(values, dtype=np.float64)
+        except ValueError as e:
+            # Report the first value that could not be converted
+            for val_str in values:
+                try:
+                    float(val_str)
+                except ValueError:
+                    raise RuntimeError(f"Cannot parse concentration value: {val_str}") from e
+            raise
@@ -2,19 +2,76 @@
 
 import os
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Mapping, MutableMapping, Optional
 
-# Try to load .env file if it exists
-env_file = Path(__file__).parent.parent / ".env"
-if env_file.exists():
-    with open(env_file) as f:
+
+def load_env_file(path: Path, environ: Optional[MutableMapping[str, str]] = None) -> None:
+    """
+    Load KEY=VALUE lines from a .env file without overriding existing variables.
+
+    Blank lines and lines starting with '#' are ignored.
+
+    Args:
+        path: Path to the .env file (missing files are ignored)
+        environ: Mapping to update (defaults to os.environ)
+    """
+    if environ is None:
+        environ = os.environ
+    if not path.exists():
+        return
+    with open(path) as f:
         for line in f:
             line = line.strip()
             if line and not line.startswith("#"):
                 key, value = line.split("=", 1)
-                os.environ.setdefault(key.strip(), value.strip())
+                environ.setdefault(key.strip(), value.strip())
+
+
+# Try to load .env file if it exists
+env_file = Path(__file__).parent.parent / ".env"
+load_env_file(env_file)
+
+
+def load_config(env: Optional[Mapping[str, str]] = None) -> SimpleNamespace:
+    """
+    Resolve the configuration values from an environment mapping.
+
+    Args:
+        env: Mapping of environment variables (defaults to os.environ)
+
+    Returns:
+        Namespace with NORMALIZ_PATH, COFFEE_CLI_PATH, FOURTI2_PATH and NUPACK_CONCENTRATIONS_PATH
+    """
+    if env is None:
+        env = os.environ
+    return SimpleNamespace(
+        NORMALIZ_PATH=env.get("NORMALIZ_PATH", "normaliz"),
+        COFFEE_CLI_PATH=env.get("COFFEE_CLI_PATH", "coffee-cli"),
+        FOURTI2_PATH=env.get("FOURTI2_PATH", "4ti2"),
+        NUPACK_CONCENTRATIONS_PATH=env.get("NUPACK_CONCENTRATIONS_PATH", "concentrations"),
+    )
+
 
 # Configuration values
-NORMALIZ_PATH = os.environ.get("NORMALIZ_PATH", "normaliz")
-COFFEE_CLI_PATH = os.environ.get("COFFEE_CLI_PATH", "coffee-cli")
-FOURTI2_PATH = os.environ.get("FOURTI2_PATH", "4ti2")
-NUPACK_CONCENTRATIONS_PATH = os.environ.get("NUPACK_CONCENTRATIONS_PATH", "concentrations")
+_config = load_config()
+NORMALIZ_PATH = _config.NORMALIZ_PATH
+COFFEE_CLI_PATH = _config.COFFEE_CLI_PATH
+FOURTI2_PATH = _config.FOURTI2_PATH
+NUPACK_CONCENTRATIONS_PATH = _config.NUPACK_CONCENTRATIONS_PATH
+
+
+def refresh() -> None:
+    """
+    Reassign the module-level configuration values from os.environ.
+
+    This only affects ``config.<name>`` attribute lookups on this module. The
+    CLI and runner modules import the values with ``from .config import ...``,
+    so they keep the values read at import time.
+    """
+    global NORMALIZ_PATH, COFFEE_CLI_PATH, FOURTI2_PATH, NUPACK_CONCENTRATIONS_PATH
+    config = load_config()
+    NORMALIZ_PATH = config.NORMALIZ_PATH
+    COFFEE_CLI_PATH = config.COFFEE_CLI_PATH
+    FOURTI2_PATH = config.FOURTI2_PATH
+    NUPACK_CONCENTRATIONS_PATH = config.NUPACK_CONCENTRATIONS_PATH
@@ -4,6 +4,7 @@ Filter module for TBN Explorer 2.
 Filters polymers from .tbnpolymat files based on monomer name criteria.
 """
 
+import heapq
 from pathlib import Path
 from typing import List, Optional, Tuple
 
@@ -184,13 +185,42 @@ class PolymerFilter:
 
                 matching_polymers.append((i, polymer_counts, free_energy, concentration))
 
+        return self._rank_polymers(matching_polymers, max_count)
+
+    def _rank_polymers(
+        self,
+        matching_polymers: List[Tuple[int, np.ndarray, Optional[float], Optional[float]]],
+        max_count: Optional[int] = None,
+    ) -> List[Tuple[int, np.ndarray, Optional[float], Optional[float]]]:
+        """
+        Sort matching polymers by decreasing concentration and apply the max_count limit.
+
+        When only the top max_count polymers are needed, a partial selection is used
+        instead of sorting the full list. Ties keep their original (polymer index) order.
+
+        Args:
+            matching_polymers: List of tuples (polymer_index, monomer_counts, free_energy, concentration)
+            max_count: Maximum number of polymers to return
+
+        Returns:
+            The ranked (and possibly truncated) list of matching polymers
+        """
+        limit = max_count if max_count is not None and max_count > 0 else None
+
         # Sort by concentration (descending) if available
         if self.polymer_data.has_concentrations:
-            matching_polymers.sort(key=lambda x: x[3] if x[3] is not None else 0, reverse=True)
+
+            def concentration_key(x):
+                return x[3] if x[3] is not None else 0
+
+            if limit is not None and limit < len(matching_polymers):
+                # heapq.nlargest is equivalent to sorted(..., reverse=True)[:limit]
+                return heapq.nlargest(limit, matching_polymers, key=concentration_key)
+            matching_polymers.sort(key=concentration_key, reverse=True)
 
         # Apply max_count limit
-        if max_count is not None and max_count > 0:
-            matching_polymers = matching_polymers[:max_count]
+        if limit is not None:
+            matching_polymers = matching_polymers[:limit]
 
         return matching_polymers
 
@@ -340,15 +370,7 @@ class PolymerFilter:
 
                 matching_polymers.append((i, polymer_counts, free_energy, concentration))
 
-        # Sort by concentration (descending) if available
-        if self.polymer_data.has_concentrations:
-            matching_polymers.sort(key=lambda x: x[3] if x[3] is not None else 0, reverse=True)
-
-        # Apply max_count limit
-        if max_count is not None and max_count > 0:
-            matching_polymers = matching_polymers[:max_count]
-
-        return matching_polymers
+        return self._rank_polymers(matching_polymers, max_count)
 
     def format_output_with_constraints(
         self,
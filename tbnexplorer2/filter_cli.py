@@ -19,8 +19,13 @@ from .completers import TBNFilesCompleter, TextFilesCompleter, monomer_names_com
 from .filter import PolymerFilter
 
 
-def main():
-    """Main entry point for the filter CLI."""
+def _build_parser():
+    """
+    Build the argument parser for the filter CLI.
+
+    Returns:
+        argparse.ArgumentParser for the tbnexplorer2-filter command
+    """
     parser = argparse.ArgumentParser(
         description="Filter polymers from .tbnpolymat files by monomer names",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -76,12 +81,32 @@ Examples:
     if TextFilesCompleter:
         constraints_arg.completer = TextFilesCompleter
 
+    return parser
+
+
+def main(argv=None):
+    """
+    Main entry point for the filter CLI.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+    """
+    parser = _build_parser()
+
     # Enable argcomplete if available
     if argcomplete:
         argcomplete.autocomplete(parser)
 
-    args = parser.parse_args()
+    _run(parser.parse_args(argv))
+
+
+def _run(args):
+    """
+    Run the filter for parsed command-line arguments.
 
+    Args:
+        args: Namespace produced by the parser from _build_parser()
+    """
     # Validate input file
     if not Path(args.tbn_file).exists():
         print(f"Error: Input file '{args.tbn_file}' not found", file=sys.stderr)
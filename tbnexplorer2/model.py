@@ -90,6 +90,7 @@ class TBN:
         self.binding_site_index = binding_site_index
         self.concentration_units = concentration_units
         self._matrix_A = None
+        self._matrix_hash = None
         self._concentrations = None
         self._concentrations_molar = None
 
@@ -220,11 +221,15 @@ class TBN:
         Compute SHA256 hash of the matrix A for caching purposes.
 
         The hash is computed from the matrix A in a deterministic way to enable
-        caching of polymer basis computations.
+        caching of polymer basis computations. Like matrix A itself, it is computed
+        once and reused.
 
         Returns:
             Hexadecimal string representation of the hash
         """
+        if self._matrix_hash is not None:
+            return self._matrix_hash
+
         # Convert matrix to bytes in a deterministic way
         # Use the matrix shape and flattened contents
         matrix_data = self.matrix_A.tobytes()
@@ -235,7 +240,8 @@ class TBN:
 
         # Compute SHA256 hash
         hash_obj = hashlib.sha256(combined_data)
-        return hash_obj.hexdigest()
+        self._matrix_hash = hash_obj.hexdigest()
+        return self._matrix_hash
 
     def __str__(self):
         n_sites = len(self.binding_site_index)
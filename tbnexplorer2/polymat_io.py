@@ -6,12 +6,16 @@ tbnexplorer2 and tbnexplorer2-filter commands.
 """
 
 import contextlib
+import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterator, List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 
+# Matches lines that carry no polymer data: comments, keyword lines and blank lines
+_NON_DATA_LINE = re.compile(r"\s*(?:[#\\]|$)")
+
 
 @dataclass
 class PolymatData:
@@ -19,7 +23,8 @@ class PolymatData:
     Structured representation of .tbnpolymat file contents.
 
     Attributes:
-        polymers: List of polymer count arrays (each array has length n_monomers)
+        polymers: Polymer count arrays, either a list of arrays of length n_monomers
+            or a 2-D array of shape (n_polymers, n_monomers)
         free_energies: Optional array of free energies for each polymer
         concentrations: Optional array of concentrations for each polymer
         n_monomers: Number of monomers in the system
@@ -31,7 +36,7 @@ class PolymatData:
         parameters: Optional dictionary of parameters used for parametrized .tbn files
     """
 
-    polymers: List[np.ndarray]
+    polymers: Union[List[np.ndarray], np.ndarray]
     n_monomers: int
     n_polymers: int
     matrix_hash: Optional[str] = None
@@ -137,6 +142,40 @@ class PolymatReader:
             parameters=header_info.get("parameters"),
         )
 
+    def read_counts(self, n_monomers: Optional[int] = None, dtype=int) -> np.ndarray:
+        """
+        Read only the monomer count columns into a single 2-D array.
+
+        Trailing free energy and concentration columns are never parsed, and all
+        count tokens are converted in one numpy call. Data lines with fewer than
+        n_monomers values are skipped.
+
+        Args:
+            n_monomers: Number of count columns (defaults to the value in the header)
+            dtype: Integer dtype of the returned array
+
+        Returns:
+            Array of shape (n_polymers, n_monomers)
+
+        Raises:
+            ValueError: If a data line has non-numeric monomer counts
+        """
+        if n_monomers is None:
+            n_monomers = self._parse_header()["n_monomers"]
+
+        count_tokens = []
+        with open(self.file_path) as f:
+            for line in f:
+                if _NON_DATA_LINE.match(line):
+                    continue
+
+                # Split off only the count columns; the remaining columns stay together
+                parts = line.split(None, n_monomers)
+                if len(parts) >= n_monomers:
+                    count_tokens.extend(parts[:n_monomers])
+
+        return np.array(count_tokens, dtype=dtype).reshape(-1, n_monomers)
+
     def read_header_only(self) -> dict:
         """
         Read only the header information without loading polymer data.
@@ -313,64 +352,116 @@ class PolymatWriter:
             data: PolymatData object to write
             from_molar_func: Optional function to convert from Molar to target units
             tbn_units: Optional TBN concentration units for conversion
+
+        Raises:
+            ValueError: If the free energies or concentrations do not have one entry per polymer
         """
+        n_polymers = len(data.polymers)
+
+        # Format each column for all polymers at once
+        columns = [self._format_count_rows(data.polymers)]
+
+        # Add free energies if available
+        if data.has_free_energies and data.free_energies is not None:
+            free_energies = np.asarray(data.free_energies).tolist()
+            self._check_column_length("free_energies", free_energies, n_polymers)
+            columns.append([str(free_energy) for free_energy in free_energies])
+
+        # Add concentrations if available
+        if data.has_concentrations and data.concentrations is not None:
+            concentrations = np.asarray(data.concentrations, dtype=float)
+            self._check_column_length("concentrations", concentrations, n_polymers)
+            # Handle unit conversion if needed
+            if from_molar_func is not None and tbn_units is not None:
+                # Convert from Molar to target units
+                concentrations = from_molar_func(concentrations, tbn_units)
+            columns.append(self._format_concentrations(concentrations))
+
+        body = "".join(" ".join(row) + "\n" for row in zip(*columns))
+
+        # Write header and body with a single call
         with open(self.file_path, "w") as f:
-            # Write header
-            self._write_header(f, data)
-
-            # Write polymer data
-            for i in range(data.n_polymers):
-                polymer_counts, free_energy, concentration = data.get_polymer_data(i)
-
-                # Write monomer counts
-                counts_str = " ".join(str(int(c)) for c in polymer_counts)
-                row = [counts_str]
-
-                # Add free energy if available
-                if data.has_free_energies and free_energy is not None:
-                    row.append(str(free_energy))
-
-                # Add concentration if available
-                if data.has_concentrations and concentration is not None:
-                    # Handle unit conversion if needed
-                    if from_molar_func is not None and tbn_units is not None:
-                        # Convert from Molar to target units
-                        conc_target = from_molar_func(concentration, tbn_units)
-                        if conc_target == 0:
-                            row.append("0.00e0")
-                        else:
-                            row.append(f"{conc_target:.2e}")
-                    else:
-                        # Use value as-is
-                        if concentration == 0:
-                            row.append("0.00e0")
-                        else:
-                            row.append(f"{concentration:.2e}")
-
-                f.write(" ".join(row) + "\n")
-
-    def _write_header(self, f, data: PolymatData):
+            f.write(self._format_header(data) + body)
+
+    @staticmethod
+    def _check_column_length(name: str, column, n_polymers: int):
+        """
+        Check that a per-polymer column has exactly one entry per polymer.
+
+        The rows are assembled with zip(), which would otherwise silently drop
+        every polymer past the end of a short column.
+
+        Args:
+            name: Column name used in the error message
+            column: Column values
+            n_polymers: Number of polymers being written
+
+        Raises:
+            ValueError: If the column length differs from n_polymers
+        """
+        if len(column) != n_polymers:
+            raise ValueError(f"Expected {n_polymers} {name} (one per polymer), got {len(column)}")
+
+    @staticmethod
+    def _format_count_rows(polymers: Union[List[np.ndarray], np.ndarray]) -> List[str]:
+        """
+        Format the monomer counts of all polymers as space-separated rows.
+
+        The counts are converted to Python ints in a single call and each row is
+        formatted with one precomputed format string.
+
+        Args:
+            polymers: Polymer count arrays (list of arrays or 2-D array)
+
+        Returns:
+            List of formatted count rows, one per polymer
+        """
+        if len(polymers) == 0:
+            return []
+
+        counts = np.asarray(polymers).astype(np.int64, copy=False)
+        row_format = " ".join(["%d"] * counts.shape[1])
+        return [row_format % tuple(row) for row in counts.tolist()]
+
+    @staticmethod
+    def _format_concentrations(concentrations: np.ndarray) -> List[str]:
         """
-        Write header section to file.
+        Format concentrations in scientific notation with two decimals.
+
+        Args:
+            concentrations: Array of concentrations, already in the target units
+
+        Returns:
+            List of formatted concentrations, with exact zeros written as "0.00e0"
+        """
+        return ["0.00e0" if concentration == 0 else f"{concentration:.2e}" for concentration in concentrations.tolist()]
+
+    def _format_header(self, data: PolymatData) -> str:
+        """
+        Format the header section of the file.
 
         Args:
-            f: File handle
             data: PolymatData object
+
+        Returns:
+            Header lines, each terminated by a newline
         """
-        f.write("# TBN Polymer Matrix\n")
-        f.write(f"# Number of polymers: {data.n_polymers}\n")
-        f.write(f"# Number of monomers: {data.n_monomers}\n")
+        lines = [
+            "# TBN Polymer Matrix",
+            f"# Number of polymers: {data.n_polymers}",
+            f"# Number of monomers: {data.n_monomers}",
+        ]
 
         if data.matrix_hash:
-            f.write(f"\\MATRIX-HASH: {data.matrix_hash}\n")
+            lines.append(f"\\MATRIX-HASH: {data.matrix_hash}")
 
         if data.parameters:
             # Write parameters in sorted order for consistency
             params_str = " ".join(f"{k}={v}" for k, v in sorted(data.parameters.items()))
-            f.write(f"\\PARAMETERS: {params_str}\n")
+            lines.append(f"\\PARAMETERS: {params_str}")
 
         if data.concentration_units:
-            f.write(f"# Concentration units: {data.concentration_units}\n")
+            lines.append(f"# Concentration units: {data.concentration_units}")
 
         # Build columns description
         columns = [f"monomer_counts[1..{data.n_monomers}]"]
@@ -378,8 +469,10 @@ class PolymatWriter:
             columns.append("free_energy")
         if data.has_concentrations:
             columns.append("concentration")
-        f.write(f"# Columns: {' '.join(columns)}\n")
-        f.write("#\n")
+        lines.append(f"# Columns: {' '.join(columns)}")
+        lines.append("#")
+
+        return "".join(line + "\n" for line in lines)
 
 
 def load_polymat_file(file_path: str, lazy_load: bool = False) -> PolymatData:
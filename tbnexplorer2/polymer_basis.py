@@ -1,5 +1,8 @@
+import contextlib
+import functools
 import math
 import os
+import tempfile
 from typing import List, Optional, Tuple
 
 import numpy as np
@@ -7,13 +10,17 @@ import numpy as np
 from .coffee import COFFEERunner
 from .model import TBN, Monomer
 from .normaliz import NormalizRunner
-from .polymat_io import PolymatData, PolymatWriter, check_matrix_hash
+from .polymat_io import PolymatData, PolymatReader, PolymatWriter, check_matrix_hash
 from .tbnpolys_io import TbnpolysWriter
 from .units import from_molar, get_unit_display_name
 
 # Boltzmann constant in kcal/mol/K
 KB = 0.001987204259
 
+# Integer dtype for monomer count vectors; counts are small and non-negative, so int32 is
+# ample and halves the memory traffic of the count matrices compared to the int64 default
+_COUNT_DTYPE = np.int32
+
 
 def _celcius_to_kelvin(temp_c: float) -> float:
     """Convert temperature from Celsius to Kelvin."""
@@ -40,8 +47,13 @@ def _water_density_mol_per_L(temp_c: float) -> float:
     return density_g_per_L / 18.0152
 
 
+@functools.lru_cache(maxsize=128)
 def _bimolecular(temp_c: float, G_BIMOLECULAR: float, H_BIMOLECULAR: float) -> float:
-    """Bimolecular association term (kcal/mol) as a function of temperature."""
+    """
+    Bimolecular association term (kcal/mol) as a function of temperature.
+
+    Cached, since every polymer in a basis shares the same temperature and parameters.
+    """
     water_density = _water_density_mol_per_L(temp_c)
     temp_k = _celcius_to_kelvin(temp_c)
 
@@ -70,9 +82,80 @@ def compute_assoc_energy_penalty(
     return _bimolecular(temp_c, G_BIMOLECULAR, H_BIMOLECULAR) * (total_monomers - 1)
 
 
+def compute_batch_free_energies(
+    monomer_counts: np.ndarray, deltaG: Optional[List[float]] = None, temperature: float = 37.0
+) -> np.ndarray:
+    """
+    Compute the free energies of many polymers at once.
+
+    Vectorized equivalent of calling Polymer.compute_free_energy on each row.
+    The bimolecular association term depends only on temperature and deltaG,
+    so it is evaluated once and scaled by each polymer's number of
+    associations (total monomers - 1).
+
+    Args:
+        monomer_counts: Array of shape (n_polymers, n_monomers) with one polymer per row
+        deltaG: List of [dG_assoc, dH_assoc]. If None (default),
+               no association penalty is applied.
+        temperature: Temperature in Celsius (default: 37.0)
+
+    Returns:
+        Array of free energies, one per polymer
+    """
+    if deltaG is None:
+        # No association penalty: every free energy is zero
+        return np.zeros(len(monomer_counts))
+
+    if len(deltaG) != 2:
+        raise ValueError("deltaG must be [dG_assoc, dH_assoc] when provided")
+    dG_assoc, dH_assoc = deltaG
+
+    total_monomers = np.sum(monomer_counts, axis=1)
+    return _bimolecular(temperature, dG_assoc, dH_assoc) * (total_monomers - 1)
+
+
+def _stack_monomer_counts(polymers: List["Polymer"], n_monomers: int) -> np.ndarray:
+    """
+    Stack the monomer count vectors of polymers into a single 2-D array.
+
+    Args:
+        polymers: List of Polymer objects
+        n_monomers: Number of monomers in the TBN (used for the empty case)
+
+    Returns:
+        numpy array of shape (n_polymers, n_monomers)
+    """
+    if not polymers:
+        return np.zeros((0, n_monomers), dtype=_COUNT_DTYPE)
+    return np.stack([polymer.monomer_counts for polymer in polymers])
+
+
+def _first_unique_rows(counts: np.ndarray) -> np.ndarray:
+    """
+    Find the first occurrence of each distinct row of a 2-D count matrix.
+
+    Each row is viewed as a single opaque byte string, so the deduplication is one
+    C-level sort and memcmp pass in np.unique rather than per-row Python hashing.
+
+    Args:
+        counts: Array of shape (n_rows, n_monomers)
+
+    Returns:
+        Sorted indices of the first occurrence of each distinct row
+    """
+    # Rows must be packed for the void view (a no-op for already contiguous input)
+    counts = np.ascontiguousarray(counts)
+    row_keys = counts.view(np.dtype((np.void, counts.dtype.itemsize * counts.shape[1]))).ravel()
+    _, first_indices = np.unique(row_keys, return_index=True)
+    return np.sort(first_indices)
+
+
 class Polymer:
     """Represents a polymer as a multiset of monomers."""
 
+    # Polymer bases can contain very many polymers; slots avoid a per-instance __dict__
+    __slots__ = ("_bytes", "monomer_counts", "monomers", "tbn")
+
     def __init__(self, monomer_counts: np.ndarray, monomers: List[Monomer], tbn: Optional["TBN"] = None):
         """
         Initialize a polymer.
@@ -85,7 +168,7 @@ class Polymer:
         self.monomer_counts = monomer_counts
         self.monomers = monomers
         self.tbn = tbn
-        self._concentration = None
+        self._bytes = None
 
     def get_monomers_with_counts(self) -> List[Tuple[int, Monomer]]:
         """
@@ -94,11 +177,9 @@ class Polymer:
         Returns:
             List of tuples (count, Monomer)
         """
-        result = []
-        for count, monomer in zip(self.monomer_counts, self.monomers):
-            if count > 0:
-                result.append((int(count), monomer))
-        return result
+        # Only visit the non-zero entries; polymer vectors are typically sparse
+        counts = np.asarray(self.monomer_counts)
+        return [(int(counts[i]), self.monomers[i]) for i in np.flatnonzero(counts > 0)]
 
     def compute_free_energy(self, deltaG: Optional[List[float]] = None, temperature: float = 37.0) -> float:
         """
@@ -143,13 +224,31 @@ class Polymer:
         # Total free energy = association penalty only
         return assoc_penalty
 
+    def _key(self) -> bytes:
+        """
+        Get the monomer counts as bytes, for fast hashing and equality checks.
+
+        Counts are normalized to int64 so that polymers compare equal regardless of
+        the integer dtype they were created with. The result is cached.
+
+        Returns:
+            Raw bytes of the monomer counts
+        """
+        if self._bytes is None:
+            self._bytes = np.asarray(self.monomer_counts, dtype=np.int64).tobytes()
+        return self._bytes
+
     def __eq__(self, other):
+        if other is self:
+            return True
         if not isinstance(other, Polymer):
             return False
-        return np.array_equal(self.monomer_counts, other.monomer_counts)
+        return self._key() == other._key()
 
     def __hash__(self):
-        return hash(tuple(self.monomer_counts))
+        # bytes objects cache their own hash, so repeated set/dict lookups only
+        # hash the count buffer once
+        return hash(self._key())
 
 
 class PolymerBasisComputer:
@@ -161,6 +260,7 @@ class PolymerBasisComputer:
         normaliz_runner: Optional[NormalizRunner] = None,
         store_solver_inputs: bool = False,
         input_base_name: Optional[str] = None,
+        basis_cache_dir: Optional[str] = None,
     ):
         """
         Initialize the polymer basis computer.
@@ -170,11 +270,14 @@ class PolymerBasisComputer:
             normaliz_runner: Optional NormalizRunner instance (creates default if None)
             store_solver_inputs: If True, store input files for debugging
             input_base_name: Base name for stored input files
+            basis_cache_dir: Optional directory where computed polymer bases are memoized
+                as .npz files keyed by the matrix hash
         """
         self.tbn = tbn
         self.normaliz_runner = normaliz_runner or NormalizRunner()
         self.store_solver_inputs = store_solver_inputs
         self.input_base_name = input_base_name
+        self.basis_cache_dir = basis_cache_dir
 
     def compute_polymer_basis(self) -> List[Polymer]:
         """
@@ -183,12 +286,22 @@ class PolymerBasisComputer:
         The polymer basis consists of the "unsplittable" polymers that cannot
         be decomposed into two without losing some bonding.
 
+        If a basis cache directory is configured, a basis previously computed for
+        the same matrix is loaded from it instead of running the solver, and newly
+        computed bases are stored there.
+
         Returns:
             List of Polymer objects representing the polymer basis
 
         Raises:
             RuntimeError: If computation fails
         """
+        cache_path = self._basis_cache_path()
+        if cache_path is not None:
+            counts = self._load_basis_cache(cache_path)
+            if counts is not None:
+                return [Polymer(polymer_vector, self.tbn.monomers, self.tbn) for polymer_vector in counts]
+
         # Get augmented matrix A' with singleton monomers
         A_prime, n_original = self.tbn.get_augmented_matrix_for_polymer_basis()
 
@@ -204,25 +317,83 @@ class PolymerBasisComputer:
         if not hilbert_basis_vectors:
             raise RuntimeError("No Hilbert basis vectors found")
 
-        # Convert Hilbert basis vectors to polymers
-        # Remove entries corresponding to fake singleton monomers and remove duplicates
-        polymers = []
-        seen = set()
+        # Stack Hilbert basis vectors into one (n_vectors, n_original) matrix,
+        # dropping the columns that correspond to fake singleton monomers. The
+        # truncated slice is strided, so copy it into a C-contiguous matrix: the
+        # byte-wise row dedup and every Polymer row view then work on packed rows.
+        counts = np.ascontiguousarray(np.asarray(hilbert_basis_vectors)[:, :n_original], dtype=_COUNT_DTYPE)
+
+        # Remove duplicate vectors, keeping the first occurrence of each, and
+        # convert the remaining rows to polymers (views into counts)
+        counts = counts[_first_unique_rows(counts)]
+
+        if cache_path is not None:
+            self._save_basis_cache(cache_path, counts)
+
+        return [Polymer(polymer_vector, self.tbn.monomers, self.tbn) for polymer_vector in counts]
 
-        for vector in hilbert_basis_vectors:
-            # Take only the first n_original components (remove fake monomers)
-            polymer_vector = vector[:n_original]
+    def _basis_cache_path(self) -> Optional[str]:
+        """
+        Get the path of the memoized basis for the current matrix.
 
-            # Create polymer object with TBN reference
-            polymer = Polymer(polymer_vector, self.tbn.monomers, self.tbn)
+        Returns:
+            Path to the .npz cache file, or None if no basis cache directory is set
+        """
+        if self.basis_cache_dir is None:
+            return None
+        return os.path.join(self.basis_cache_dir, f"polybasis_{self.tbn.compute_matrix_hash()}.npz")
 
-            # Check for duplicates
-            polymer_hash = hash(polymer)
-            if polymer_hash not in seen:
-                seen.add(polymer_hash)
-                polymers.append(polymer)
+    def _load_basis_cache(self, cache_path: str) -> Optional[np.ndarray]:
+        """
+        Load a memoized polymer basis count matrix.
 
-        return polymers
+        Args:
+            cache_path: Path to the .npz cache file
+
+        Returns:
+            Count matrix of shape (n_polymers, n_monomers), or None if the cache is
+            missing, unreadable or does not match the current TBN
+        """
+        try:
+            with np.load(cache_path, allow_pickle=False) as cached:
+                matrix_hash = str(cached["matrix_hash"])
+                counts = cached["counts"].astype(_COUNT_DTYPE)
+        except Exception:
+            # A truncated or corrupt archive can fail in many ways (BadZipFile, zlib.error,
+            # EOFError, ...); treat all of them as a cache miss so the basis is recomputed
+            return None
+
+        if matrix_hash != self.tbn.compute_matrix_hash() or counts.ndim != 2:
+            return None
+        if counts.shape[1] != len(self.tbn.monomers):
+            return None
+        return counts
+
+    def _save_basis_cache(self, cache_path: str, counts: np.ndarray):
+        """
+        Memoize a computed polymer basis count matrix.
+
+        The archive is written to a temporary file in the cache directory and then
+        renamed onto cache_path, so an interrupted or concurrent run never leaves a
+        half-written cache behind. Failures to write the cache are ignored; the cache
+        is only an optimization.
+
+        Args:
+            cache_path: Path to the .npz cache file
+            counts: Count matrix of shape (n_polymers, n_monomers)
+        """
+        temp_path = None
+        try:
+            cache_dir = os.path.dirname(cache_path)
+            os.makedirs(cache_dir, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=cache_dir, delete=False, suffix=".npz") as f:
+                temp_path = f.name
+                np.savez_compressed(f, counts=counts, matrix_hash=np.array(self.tbn.compute_matrix_hash()))
+            os.replace(temp_path, cache_path)
+        except OSError:
+            if temp_path is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(temp_path)
 
     def save_polymer_basis(self, polymers: List[Polymer], output_file: str):
         """
@@ -241,14 +412,12 @@ class PolymerBasisComputer:
         """
         from pathlib import Path
 
-        # Convert polymers to vectors
-        polymer_vectors = [polymer.monomer_counts for polymer in polymers]
+        # Stack polymers into a single (n_polymers, n_monomers) matrix
+        counts = _stack_monomer_counts(polymers, len(self.tbn.monomers))
 
         # Create writer and save
         writer = TbnpolysWriter(self.tbn)
-        writer.write_polymers(
-            polymer_vectors, Path(output_file), header_comment=f"Polymer basis - {len(polymers)} polymers"
-        )
+        writer.write_polymers(counts, Path(output_file), header_comment=f"Polymer basis - {len(polymers)} polymers")
 
         print(f"Saved polymer basis with {len(polymers)} polymers to {output_file}")
 
@@ -271,44 +440,14 @@ class PolymerBasisComputer:
             if not check_matrix_hash(polymat_file, current_hash):
                 return None
 
-            # For backward compatibility with the old implementation:
-            # Try to parse file manually to handle edge cases
-            polymers = []
-            has_parse_error = False
-
-            with open(polymat_file) as f:
-                for line in f:
-                    line = line.strip()
-                    # Skip comments and keyword lines
-                    if line.startswith("#") or line.startswith("\\") or not line:
-                        continue
-
-                    parts = line.split()
-                    if not parts:
-                        continue
-
-                    # Check if we have the right number of values
-                    n_monomers = len(self.tbn.monomers)
-                    if len(parts) < n_monomers:
-                        # Wrong number of columns - skip this line
-                        continue
-
-                    # Try to parse monomer counts
-                    try:
-                        monomer_counts = np.array([int(x) for x in parts[:n_monomers]])
-                        polymer = Polymer(monomer_counts, self.tbn.monomers, self.tbn)
-                        polymers.append(polymer)
-                    except ValueError:
-                        # Non-numeric data - this is a parse error
-                        has_parse_error = True
-                        break
-
-            # If we had parse errors (non-numeric data), return None
-            if has_parse_error:
+            # Read just the monomer count columns; non-numeric counts are a parse error
+            try:
+                counts = PolymatReader(polymat_file).read_counts(len(self.tbn.monomers), dtype=_COUNT_DTYPE)
+            except ValueError:
                 return None
 
-            # Otherwise return the polymers (could be empty list)
-            return polymers
+            # Return the polymers (could be empty list), each backed by a row view
+            return [Polymer(row, self.tbn.monomers, self.tbn) for row in counts]
 
         except Exception:
             # If any error occurs during loading, return None to recompute
@@ -363,36 +502,33 @@ class PolymerBasisComputer:
                 )
                 if verbose:
                     print("Equilibrium concentrations computed")
-                # Attach concentrations to polymers for sorting
-                for polymer, conc in zip(polymers, polymer_concentrations):
-                    polymer._concentration = conc
             except Exception as e:
                 print(f"Warning: Could not compute concentrations: {e}")
                 include_concentrations = False
 
+        # Stack polymers into a single (n_polymers, n_monomers) matrix
+        counts = _stack_monomer_counts(polymers, len(self.tbn.monomers))
+
         # Sort polymers by concentration if available
         if include_concentrations and polymer_concentrations is not None:
-            # Sort by concentration in descending order
-            sorted_indices = np.argsort(-polymer_concentrations)
-            sorted_polymers = [polymers[i] for i in sorted_indices]
+            # Sort by concentration in descending order; the counts matrix and the
+            # concentrations are permuted together, the Polymer list is not needed
+            sorted_indices = np.argsort(-polymer_concentrations, kind="stable")
+            counts = counts[sorted_indices]
             sorted_concentrations = polymer_concentrations[sorted_indices]
         else:
-            sorted_polymers = polymers
             sorted_concentrations = None
 
-        # Prepare polymer data for PolymatData
-        polymer_arrays = [polymer.monomer_counts for polymer in sorted_polymers]
-
         # Compute free energies if requested
         free_energies = None
         if include_free_energies:
-            free_energies = np.array([polymer.compute_free_energy(deltaG, temperature) for polymer in sorted_polymers])
+            free_energies = compute_batch_free_energies(counts, deltaG, temperature)
 
         # Create PolymatData object
         polymat_data = PolymatData(
-            polymers=polymer_arrays,
+            polymers=counts,
             n_monomers=len(self.tbn.monomers),
-            n_polymers=len(sorted_polymers),
+            n_polymers=len(counts),
             matrix_hash=self.tbn.compute_matrix_hash(),
             free_energies=free_energies,
             concentrations=sorted_concentrations,
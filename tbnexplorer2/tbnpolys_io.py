@@ -9,12 +9,35 @@ Format specification:
 - Monomers are specified by name or binding site representation
 """
 
+import bisect
 import re
 from pathlib import Path
-from typing import Any, List, Optional, Tuple
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from .model import TBN, Monomer
 
+# Matches a monomer line with a multiplicity prefix "n | monomer"
+_MULTIPLICITY_PREFIX = re.compile(r"^(\d+)\s*\|\s*(.+)$")
+
+# Concentration display formats: _CONCENTRATION_FORMATS[i] applies to values in
+# [_CONCENTRATION_THRESHOLDS[i-1], _CONCENTRATION_THRESHOLDS[i]), so the format is found by bisection
+_CONCENTRATION_THRESHOLDS = (0.01, 1, 10, 100, 1000)
+_CONCENTRATION_FORMATS = (".2e", ".4f", ".3f", ".2f", ".1f", ".1e")
+
+
+def _sorted_site_names(monomer: Monomer) -> Tuple[str, ...]:
+    """Get a monomer's binding site names (with "*" for star sites) in sorted order.
+
+    Args:
+        monomer: Monomer object
+
+    Returns:
+        Sorted tuple of binding site names
+    """
+    return tuple(sorted(site.name + ("*" if site.is_star else "") for site in monomer.binding_sites))
+
 
 class TbnpolysParser:
     """Parser for .tbnpolys files."""
@@ -27,6 +50,19 @@ class TbnpolysParser:
         """
         self.tbn = tbn
 
+        # Index monomers by name and by sorted binding sites for constant-time lookup
+        # (the first monomer wins on duplicates, as with a linear scan)
+        self._monomers_by_name = {}
+        self._monomers_by_sites = {}
+        self._sorted_sites = {}
+        if tbn:
+            for monomer in tbn.monomers:
+                sorted_sites = _sorted_site_names(monomer)
+                if monomer.name:
+                    self._monomers_by_name.setdefault(monomer.name, monomer)
+                self._monomers_by_sites.setdefault(sorted_sites, monomer)
+                self._sorted_sites[id(monomer)] = sorted_sites
+
     def parse_file(self, file_path: Path) -> List[List[Tuple[int, Any]]]:
         """Parse a .tbnpolys file.
 
@@ -38,8 +74,7 @@ class TbnpolysParser:
             The monomer can be either a string (name or binding sites) or a Monomer object if TBN is available.
         """
         with open(file_path) as f:
-            content = f.read()
-        return self.parse_content(content)
+            return self._parse_lines(f)
 
     def parse_content(self, content: str) -> List[List[Tuple[int, Any]]]:
         """Parse .tbnpolys content.
@@ -50,28 +85,31 @@ class TbnpolysParser:
         Returns:
             List of polymers, where each polymer is a list of (multiplicity, monomer) tuples.
         """
-        polymers = []
-        current_polymer = []
+        return self._parse_lines(content.splitlines())
+
+    def _parse_lines(self, lines: Iterable[str]) -> List[List[Tuple[int, Any]]]:
+        """Parse .tbnpolys content one line at a time.
 
-        lines = content.split("\n")
-        i = 0
-        while i < len(lines):
-            original_line = lines[i]
-            line = original_line.strip()
+        Args:
+            lines: Iterable of lines, e.g. an open file or a list of strings
 
-            # Check if this is a comment-only line (shouldn't count as empty)
-            is_comment_only = line.startswith("#")
+        Returns:
+            List of polymers, where each polymer is a list of (multiplicity, monomer) tuples.
+        """
+        polymers = []
+        current_polymer = []
 
-            # Remove comments from non-comment-only lines
-            if not is_comment_only and "#" in line:
-                line = line[: line.index("#")].strip()
+        for original_line in lines:
+            # Remove comments with a single scan for "#"
+            line, comment_marker, _ = original_line.partition("#")
+            line = line.strip()
 
             # Empty line signals end of current polymer (but not comment-only lines)
-            if not line and not is_comment_only:
+            if not line and not comment_marker:
                 if current_polymer:
                     polymers.append(current_polymer)
                     current_polymer = []
-            elif not is_comment_only and line:
+            elif line:
                 # Parse monomer line
                 multiplicity, monomer_spec = self._parse_monomer_line(line)
                 if self.tbn:
@@ -80,8 +118,6 @@ class TbnpolysParser:
                 else:
                     current_polymer.append((multiplicity, monomer_spec))
 
-            i += 1
-
         # Add the last polymer if exists
         if current_polymer:
             polymers.append(current_polymer)
@@ -98,7 +134,7 @@ class TbnpolysParser:
             Tuple of (multiplicity, monomer_spec)
         """
         # Check for multiplicity prefix "n | "
-        match = re.match(r"^(\d+)\s*\|\s*(.+)$", line)
+        match = _MULTIPLICITY_PREFIX.match(line)
         if match:
             multiplicity = int(match.group(1))
             monomer_spec = match.group(2).strip()
@@ -132,41 +168,32 @@ class TbnpolysParser:
                 binding_sites_str = parts[1].strip()
 
                 # Try to find monomer by name
-                for monomer in self.tbn.monomers:
-                    if monomer.name == name:
-                        # Verify that binding sites match
-                        provided_sites = sorted(binding_sites_str.split())
-                        monomer_sites = []
-                        for site in monomer.binding_sites:
-                            monomer_sites.append(site.name + ("*" if site.is_star else ""))
-                        monomer_sites = sorted(monomer_sites)
-
-                        if provided_sites != monomer_sites:
-                            raise ValueError(
-                                f"Monomer '{name}' exists but binding sites don't match. "
-                                f"Expected: {' '.join(monomer_sites)}, "
-                                f"Got: {' '.join(provided_sites)}"
-                            )
-                        return monomer
-
-                # Name not found, raise error
-                raise ValueError(f"Monomer with name '{name}' not found in TBN file")
-
-        # First check if it's a monomer name (without colon syntax)
-        for monomer in self.tbn.monomers:
-            if monomer.name == monomer_spec:
+                monomer = self._monomers_by_name.get(name)
+                if monomer is None:
+                    # Name not found, raise error
+                    raise ValueError(f"Monomer with name '{name}' not found in TBN file")
+
+                # Verify that binding sites match
+                provided_sites = tuple(sorted(binding_sites_str.split()))
+                monomer_sites = self._sorted_sites[id(monomer)]
+
+                if provided_sites != monomer_sites:
+                    raise ValueError(
+                        f"Monomer '{name}' exists but binding sites don't match. "
+                        f"Expected: {' '.join(monomer_sites)}, "
+                        f"Got: {' '.join(provided_sites)}"
+                    )
                 return monomer
 
-        # Try to parse as binding sites
-        binding_sites = monomer_spec.split()
-        for monomer in self.tbn.monomers:
-            # Check if binding sites match (order doesn't matter according to spec)
-            monomer_sites = []
-            for site in monomer.binding_sites:
-                monomer_sites.append(site.name + ("*" if site.is_star else ""))
+        # First check if it's a monomer name (without colon syntax)
+        monomer = self._monomers_by_name.get(monomer_spec)
+        if monomer is not None:
+            return monomer
 
-            if sorted(binding_sites) == sorted(monomer_sites):
-                return monomer
+        # Try to parse as binding sites (order doesn't matter according to spec)
+        monomer = self._monomers_by_sites.get(tuple(sorted(monomer_spec.split())))
+        if monomer is not None:
+            return monomer
 
         raise ValueError(f"Cannot resolve monomer: {monomer_spec}")
 
@@ -182,6 +209,9 @@ class TbnpolysWriter:
         """
         self.tbn = tbn
 
+        # Display spec of each monomer, indexed like tbn.monomers
+        self._monomer_specs = [self._get_monomer_spec(monomer) for monomer in tbn.monomers]
+
     def write_polymers(
         self,
         polymers: List[List[int]],
@@ -199,9 +229,12 @@ class TbnpolysWriter:
             units: Optional concentration units
             header_comment: Optional header comment
         """
-        content = self.format_polymers(polymers, concentrations, units, header_comment)
+        # Stream the blocks to the file instead of building the whole content first
         with open(file_path, "w") as f:
-            f.write(content)
+            for i, block in enumerate(self._iter_blocks(polymers, concentrations, units, header_comment)):
+                if i:
+                    f.write("\n\n")
+                f.write(block)
 
     def format_polymers(
         self,
@@ -221,52 +254,80 @@ class TbnpolysWriter:
         Returns:
             Formatted .tbnpolys content
         """
-        lines = []
+        return "\n\n".join(self._iter_blocks(polymers, concentrations, units, header_comment))
+
+    def _iter_blocks(
+        self,
+        polymers: List[List[int]],
+        concentrations: Optional[List[float]] = None,
+        units: Optional[str] = None,
+        header_comment: Optional[str] = None,
+    ) -> Iterator[str]:
+        """Generate the text blocks of .tbnpolys content.
+
+        Blocks are the header comment (if any) followed by one block per polymer,
+        and are meant to be separated by an empty line.
+
+        Args:
+            polymers: List of polymer vectors (monomer counts)
+            concentrations: Optional list of polymer concentrations
+            units: Optional concentration units
+            header_comment: Optional header comment
 
+        Yields:
+            Text of each block, without a trailing newline
+        """
         # Add header comment if provided
         if header_comment:
-            for line in header_comment.split("\n"):
-                lines.append(f"# {line}")
-            lines.append("")
+            yield "\n".join(f"# {line}" for line in header_comment.split("\n"))
+
+        # For a 2-D count matrix, locate the monomers of every polymer in a single
+        # pass over the matrix (CSR-style) instead of scanning each row separately
+        monomer_indices = None
+        if isinstance(polymers, np.ndarray) and polymers.ndim == 2:
+            rows, cols = np.nonzero(polymers > 0)
+            monomer_indices = np.split(cols, np.searchsorted(rows, np.arange(1, len(polymers))))
 
         # Format each polymer
         for i, polymer in enumerate(polymers):
-            polymer_lines = self._format_single_polymer(polymer)
+            polymer_lines = self._format_single_polymer(
+                polymer, monomer_indices[i] if monomer_indices is not None else None
+            )
 
             # Add concentration as comment if provided
             if concentrations and i < len(concentrations):
                 conc_str = self._format_concentration(concentrations[i], units)
                 polymer_lines.append(f"# Concentration: {conc_str}")
 
-            lines.extend(polymer_lines)
-            lines.append("")  # Empty line between polymers
-
-        # Remove trailing empty line
-        if lines and lines[-1] == "":
-            lines.pop()
-
-        return "\n".join(lines)
+            yield "\n".join(polymer_lines)
 
-    def _format_single_polymer(self, polymer: List[int]) -> List[str]:
+    def _format_single_polymer(self, polymer: List[int], monomer_indices: Optional[Sequence[int]] = None) -> List[str]:
         """Format a single polymer.
 
         Args:
             polymer: Polymer vector (monomer counts)
+            monomer_indices: Optional precomputed indices of the monomers with non-zero count
 
         Returns:
             List of lines representing the polymer
         """
+        if monomer_indices is None:
+            if isinstance(polymer, np.ndarray):
+                # Scan for the non-zero entries in C; polymer vectors are typically sparse
+                monomer_indices = np.flatnonzero(polymer > 0)
+            else:
+                monomer_indices = [monomer_idx for monomer_idx, count in enumerate(polymer) if count > 0]
+
         lines = []
 
-        for monomer_idx, count in enumerate(polymer):
-            if count > 0:
-                monomer = self.tbn.monomers[monomer_idx]
-                monomer_spec = self._get_monomer_spec(monomer)
+        for monomer_idx in monomer_indices:
+            count = polymer[monomer_idx]
+            monomer_spec = self._monomer_specs[monomer_idx]
 
-                if count == 1:
-                    lines.append(monomer_spec)
-                else:
-                    lines.append(f"{count} | {monomer_spec}")
+            if count == 1:
+                lines.append(monomer_spec)
+            else:
+                lines.append(f"{count} | {monomer_spec}")
 
         return lines
 
@@ -301,18 +362,9 @@ class TbnpolysWriter:
         # Format concentration nicely (avoid scientific notation for reasonable values)
         if concentration == 0:
             conc_str = "0"
-        elif concentration >= 1000:
-            conc_str = f"{concentration:.1e}"
-        elif concentration >= 100:
-            conc_str = f"{concentration:.1f}"
-        elif concentration >= 10:
-            conc_str = f"{concentration:.2f}"
-        elif concentration >= 1:
-            conc_str = f"{concentration:.3f}"
-        elif concentration >= 0.01:
-            conc_str = f"{concentration:.4f}"
         else:
-            conc_str = f"{concentration:.2e}"
+            conc_format = _CONCENTRATION_FORMATS[bisect.bisect_right(_CONCENTRATION_THRESHOLDS, concentration)]
+            conc_str = format(concentration, conc_format)
 
         if units:
             conc_str += f" {units}"
@@ -16,8 +16,19 @@ import numpy as np
 # Conversion factors to Molar
 UNIT_TO_MOLAR = {"pM": 1e-12, "nM": 1e-9, "uM": 1e-6, "mM": 1e-3, "M": 1.0}
 
-# Valid concentration units
-VALID_UNITS = list(UNIT_TO_MOLAR.keys())
+# Valid concentration units, in display order
+VALID_UNITS = tuple(UNIT_TO_MOLAR)
+
+# Constant-time membership checks and the error message listing, built once
+_VALID_UNITS_SET = frozenset(VALID_UNITS)
+_VALID_UNITS_STR = ", ".join(VALID_UNITS)
+
+# Combined factors for converting directly between any two units with a single multiplication
+_CONVERSION_FACTORS = {
+    (from_unit, to_unit): UNIT_TO_MOLAR[from_unit] / UNIT_TO_MOLAR[to_unit]
+    for from_unit in UNIT_TO_MOLAR
+    for to_unit in UNIT_TO_MOLAR
+}
 
 
 def validate_unit(unit: str) -> str:
@@ -33,9 +44,8 @@ def validate_unit(unit: str) -> str:
     Raises:
         ValueError: If unit is not supported
     """
-    if unit not in VALID_UNITS:
-        valid_units_str = ", ".join(VALID_UNITS)
-        raise ValueError(f"Invalid concentration unit '{unit}'. Supported units: {valid_units_str}")
+    if unit not in _VALID_UNITS_SET:
+        raise ValueError(f"Invalid concentration unit '{unit}'. Supported units: {_VALID_UNITS_STR}")
     return unit
 
 
@@ -95,9 +105,11 @@ def convert_concentration(value: Union[float, np.ndarray], from_unit: str, to_un
     if from_unit == to_unit:
         return value
 
-    # Convert through Molar
-    molar_value = to_molar(value, from_unit)
-    return from_molar(molar_value, to_unit)
+    validate_unit(from_unit)
+    validate_unit(to_unit)
+
+    # One multiplication by the combined factor, without an intermediate Molar array
+    return value * _CONVERSION_FACTORS[(from_unit, to_unit)]
 
 
 def get_unit_display_name(unit: str) -> str:
@@ -0,0 +1,62 @@
+"""Shared mock setup for the tbnexplorer2 CLI tests."""
+
+import contextlib
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+
+class _StubTBN:
+    """Stand-in for the TBN instance the CLI builds: an empty, optionally star-limited model."""
+
+    def __init__(self, star_limiting):
+        self._star_limiting = star_limiting
+        self.matrix_A = np.zeros((0, 0), dtype=np.int64)
+        self.concentrations = None
+
+    def check_star_limiting(self):
+        return self._star_limiting
+
+
+class _StubNormalizRunner:
+    """Stand-in for a NormalizRunner whose executable is available."""
+
+    def check_normaliz_available(self):
+        return True
+
+
+@contextlib.contextmanager
+def mocked_cli(parse_return=([], {}, None, {}), star_limiting=(True, None)):
+    """Patch the classes the CLI uses so it runs without parsing files or calling solvers.
+
+    Args:
+        parse_return: Value returned by TBNParser.parse_file
+        star_limiting: Value returned by TBN.check_star_limiting
+
+    Yields:
+        SimpleNamespace with the patched classes (parser, tbn, normaliz, computer)
+        and the instances they return (tbn_instance, normaliz_instance, computer_instance)
+    """
+    with contextlib.ExitStack() as stack:
+        m = SimpleNamespace(
+            parser=stack.enter_context(patch("tbnexplorer2.cli.TBNParser")),
+            tbn=stack.enter_context(patch("tbnexplorer2.cli.TBN")),
+            normaliz=stack.enter_context(patch("tbnexplorer2.cli.NormalizRunner")),
+            computer=stack.enter_context(patch("tbnexplorer2.cli.PolymerBasisComputer")),
+        )
+        m.parser.parse_file.return_value = parse_return
+
+        # Plain stubs for the instances whose calls are never asserted on; the
+        # patched classes stay mocks so their constructor calls can be checked
+        m.tbn_instance = _StubTBN(star_limiting)
+        m.tbn.return_value = m.tbn_instance
+
+        m.normaliz_instance = _StubNormalizRunner()
+        m.normaliz.return_value = m.normaliz_instance
+
+        m.computer_instance = MagicMock()
+        m.computer_instance.compute_polymer_basis.return_value = []
+        m.computer.return_value = m.computer_instance
+
+        yield m
@@ -0,0 +1,20 @@
+"""Shared pytest fixtures for the tbnexplorer2 tests."""
+
+import pytest
+
+
+def pytest_configure(config):
+    """Register the custom markers used by the test suite."""
+    config.addinivalue_line("markers", "slow: long-running end-to-end tests (deselect with '-m \"not slow\"')")
+
+
+@pytest.fixture(scope="session")
+def tbn_file(tmp_path_factory):
+    """Write a small TBN file with nM concentrations once per test session."""
+    path = tmp_path_factory.mktemp("cli") / "test.tbn"
+    path.write_text("""# Test TBN file with concentrations
+\\UNITS: nM
+A: a a*, 100.0
+B: b b*, 50.0
+""")
+    return path
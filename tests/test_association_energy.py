@@ -1,15 +1,38 @@
 """Tests for association energy penalty calculations."""
 
-import math
 import unittest
 
+import numpy as np
+
 from tbnexplorer2.polymer_basis import (
     _bimolecular,
     _celcius_to_kelvin,
     _water_density_mol_per_L,
     compute_assoc_energy_penalty,
+    compute_batch_free_energies,
 )
 
+# Reference values computed once offline, so the tests check against fixed numbers
+# rather than re-evaluating the production formulas.
+_WATER_DENSITY_ORACLE = {
+    4.0: 55.5072909379,
+    25.0: 55.3447656241,
+    37.0: 55.1383806323,
+    50.0: 54.8442358434,
+}
+
+# _bimolecular(temp_c, G, H) keyed by (temp_c, G, H)
+_ORACLE = {
+    (4.0, 0.0, 0.0): -2.2121099970,
+    (25.0, 0.0, 0.0): -2.3779869808,
+    (37.0, 0.0, 0.0): -2.4713940254,
+    (50.0, 0.0, 0.0): -2.5715481004,
+    (4.0, 5.0, 3.0): 2.5750897451,
+    (25.0, 5.0, 3.0): 2.5446311072,
+    (37.0, 5.0, 3.0): 2.5286059746,
+    (50.0, 5.0, 3.0): 2.5122823043,
+}
+
 
 class TestAssociationEnergy(unittest.TestCase):
     """Test association energy penalty calculations."""
@@ -35,24 +58,17 @@ class TestAssociationEnergy(unittest.TestCase):
         density_4 = _water_density_mol_per_L(4.0)
         self.assertAlmostEqual(density_4, 55.6, delta=0.5)
 
+        for temp_c, expected in _WATER_DENSITY_ORACLE.items():
+            with self.subTest(temp_c=temp_c):
+                self.assertAlmostEqual(_water_density_mol_per_L(temp_c), expected, places=8)
+
     def test_bimolecular(self):
         """Test bimolecular association term calculation."""
-        # Test with zero G and H - should only have the water density term
-        KB = 0.001987204259
-        temp_c = 37.0
-        temp_k = 310.15
-        water_density = _water_density_mol_per_L(temp_c)
-
-        expected = -KB * temp_k * math.log(water_density)
-        result = _bimolecular(temp_c, 0.0, 0.0)
-        self.assertAlmostEqual(result, expected, places=6)
-
-        # Test with non-zero G and H
-        G = 5.0
-        H = 3.0
-        expected = (G - H) * temp_k / 310.15 + H - KB * temp_k * math.log(water_density)
-        result = _bimolecular(temp_c, G, H)
-        self.assertAlmostEqual(result, expected, places=6)
+        # With zero G and H only the water density term remains (negative);
+        # the oracle also covers non-zero G and H across temperatures
+        for (temp_c, G, H), expected in _ORACLE.items():
+            with self.subTest(temp_c=temp_c, G=G, H=H):
+                self.assertAlmostEqual(_bimolecular(temp_c, G, H), expected, places=8)
 
     def test_assoc_energy_penalty_single_monomer(self):
         """Test that single monomer has zero association penalty."""
@@ -66,7 +82,7 @@ class TestAssociationEnergy(unittest.TestCase):
         H = 3.0
 
         # For 2 monomers, penalty = bimolecular * (2 - 1) = bimolecular
-        expected = _bimolecular(temp_c, G, H)
+        expected = _ORACLE[(temp_c, G, H)]
         result = compute_assoc_energy_penalty(2, temp_c, G, H)
         self.assertAlmostEqual(result, expected, places=6)
 
@@ -75,7 +91,7 @@ class TestAssociationEnergy(unittest.TestCase):
         temp_c = 37.0
         G = 5.0
         H = 3.0
-        bimol = _bimolecular(temp_c, G, H)
+        bimol = _ORACLE[(temp_c, G, H)]
 
         # Test for various polymer sizes
         for n_monomers in [3, 5, 10]:
@@ -109,12 +125,23 @@ class TestAssociationEnergy(unittest.TestCase):
         self.assertLess(penalty, 0)
 
         # Check exact value
-        KB = 0.001987204259
-        temp_k = 310.15
-        water_density = _water_density_mol_per_L(temp_c)
-        expected = -KB * temp_k * math.log(water_density) * (n_monomers - 1)
+        expected = _ORACLE[(temp_c, 0.0, 0.0)] * (n_monomers - 1)
         self.assertAlmostEqual(penalty, expected, places=6)
 
+    def test_batch_free_energies(self):
+        """Test batched free energies against the per-polymer penalty."""
+        counts = np.array([[1, 0, 0], [1, 1, 0], [2, 1, 2]])
+
+        energies = compute_batch_free_energies(counts, [5.0, 3.0], 25.0)
+        expected = [compute_assoc_energy_penalty(int(n), 25.0, 5.0, 3.0) for n in counts.sum(axis=1)]
+        np.testing.assert_allclose(energies, expected)
+
+        # Without deltaG there is no association penalty
+        np.testing.assert_array_equal(compute_batch_free_energies(counts), np.zeros(3))
+
+        with self.assertRaises(ValueError):
+            compute_batch_free_energies(counts, [5.0])
+
 
 if __name__ == "__main__":
     unittest.main()
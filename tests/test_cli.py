@@ -1,27 +1,39 @@
 #!/usr/bin/env python3
 """Tests for the CLI module."""
 
-import sys
+import contextlib
 import tempfile
 import unittest
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
-# Add parent directory to path to import tbnexplorer2
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from tbnexplorer2.cli import _build_parser, _run, main
+from tests._cli_fixtures import mocked_cli
+
+# Built once per process; tests run the pipeline directly on parsed Namespaces
+_PARSER = _build_parser()
 
-import contextlib
 
-from tbnexplorer2.cli import main
+class _MockedCLITestCase(unittest.TestCase):
+    """Base class that patches the CLI's parser, model and solver classes for each test."""
+
+    def setUp(self):
+        """Install the CLI patches; they are removed again on cleanup."""
+        stack = contextlib.ExitStack()
+        self.addCleanup(stack.close)
+        self.cli = stack.enter_context(mocked_cli())
 
 
-class TestCLIOutputFileLocation(unittest.TestCase):
+class TestCLIOutputFileLocation(_MockedCLITestCase):
     """Test that output files are created in the correct location."""
 
     def setUp(self):
         """Set up test fixtures."""
-        # Create a temporary directory for tests
-        self.test_dir = tempfile.mkdtemp()
+        super().setUp()
+        # Create a temporary directory for tests, removed on cleanup
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.test_dir = self._tmp.name
         self.subdir = Path(self.test_dir) / "subdir"
         self.subdir.mkdir()
 
@@ -31,12 +43,6 @@ monomer1: a b
 monomer2: a* b*
 """
 
-    def tearDown(self):
-        """Clean up test fixtures."""
-        import shutil
-
-        shutil.rmtree(self.test_dir)
-
     def test_default_output_same_directory_as_input(self):
         """Test that default output file is created in the same directory as input."""
         # Create test TBN file in subdirectory
@@ -46,34 +52,15 @@ monomer2: a* b*
         # Expected output file path
         expected_output = self.subdir / "test-polymer-basis.tbnpolys"
 
-        # Mock the necessary components to avoid actual computation
-        with patch("tbnexplorer2.cli.TBNParser") as mock_parser, patch("tbnexplorer2.cli.TBN") as mock_tbn, patch(
-            "tbnexplorer2.cli.NormalizRunner"
-        ) as mock_normaliz, patch("tbnexplorer2.cli.PolymerBasisComputer") as mock_computer:
-            # Set up mocks
-            mock_parser.parse_file.return_value = ([], {}, None, {})
-            mock_tbn_instance = MagicMock()
-            mock_tbn_instance.check_star_limiting.return_value = (True, None)
-            mock_tbn_instance.matrix_A = MagicMock(shape=(0, 0))
-            mock_tbn.return_value = mock_tbn_instance
-
-            mock_normaliz_instance = MagicMock()
-            mock_normaliz_instance.check_normaliz_available.return_value = True
-            mock_normaliz.return_value = mock_normaliz_instance
-
-            mock_computer_instance = MagicMock()
-            mock_computer_instance.compute_polymer_basis.return_value = []
-            mock_computer.return_value = mock_computer_instance
-
-            # Run the CLI with the test file and user-friendly flag
-            test_args = ["tbnexplorer2", str(input_file), "--user-friendly-polymer-basis"]
-            with patch("sys.argv", test_args), contextlib.suppress(SystemExit):
-                main()  # main() calls sys.exit(0) on success
-
-            # Verify that save_polymer_basis was called with the correct path
-            mock_computer_instance.save_polymer_basis.assert_called_once()
-            actual_output = mock_computer_instance.save_polymer_basis.call_args[0][1]
-            self.assertEqual(actual_output, str(expected_output))
+        # Run the CLI with the test file and user-friendly flag
+        test_args = ["tbnexplorer2", str(input_file), "--user-friendly-polymer-basis"]
+        with patch("sys.argv", test_args), contextlib.suppress(SystemExit):
+            main()  # main() calls sys.exit(0) on success
+
+        # Verify that save_polymer_basis was called with the correct path
+        self.cli.computer_instance.save_polymer_basis.assert_called_once()
+        actual_output = self.cli.computer_instance.save_polymer_basis.call_args[0][1]
+        self.assertEqual(actual_output, str(expected_output))
 
     def test_explicit_output_file_path_respected(self):
         """Test that explicitly specified output file path is used."""
@@ -84,40 +71,15 @@ monomer2: a* b*
         # Explicit output file in different location
         explicit_output = Path(self.test_dir) / "custom-output.txt"
 
-        # Mock the necessary components
-        with patch("tbnexplorer2.cli.TBNParser") as mock_parser, patch("tbnexplorer2.cli.TBN") as mock_tbn, patch(
-            "tbnexplorer2.cli.NormalizRunner"
-        ) as mock_normaliz, patch("tbnexplorer2.cli.PolymerBasisComputer") as mock_computer:
-            # Set up mocks
-            mock_parser.parse_file.return_value = ([], {}, None, {})
-            mock_tbn_instance = MagicMock()
-            mock_tbn_instance.check_star_limiting.return_value = (True, None)
-            mock_tbn_instance.matrix_A = MagicMock(shape=(0, 0))
-            mock_tbn.return_value = mock_tbn_instance
-
-            mock_normaliz_instance = MagicMock()
-            mock_normaliz_instance.check_normaliz_available.return_value = True
-            mock_normaliz.return_value = mock_normaliz_instance
-
-            mock_computer_instance = MagicMock()
-            mock_computer_instance.compute_polymer_basis.return_value = []
-            mock_computer.return_value = mock_computer_instance
-
-            # Run the CLI with explicit output file and user-friendly flag
-            test_args = [
-                "tbnexplorer2",
-                str(input_file),
-                "--user-friendly-polymer-basis",
-                "--output",
-                str(explicit_output),
-            ]
-            with patch("sys.argv", test_args), contextlib.suppress(SystemExit):
-                main()
-
-            # Verify that save_polymer_basis was called with the explicit path
-            mock_computer_instance.save_polymer_basis.assert_called_once()
-            actual_output = mock_computer_instance.save_polymer_basis.call_args[0][1]
-            self.assertEqual(actual_output, str(explicit_output))
+        # Run the CLI with explicit output file and user-friendly flag
+        args = _PARSER.parse_args([str(input_file), "--user-friendly-polymer-basis", "--output", str(explicit_output)])
+        with contextlib.suppress(SystemExit):
+            _run(args)
+
+        # Verify that save_polymer_basis was called with the explicit path
+        self.cli.computer_instance.save_polymer_basis.assert_called_once()
+        actual_output = self.cli.computer_instance.save_polymer_basis.call_args[0][1]
+        self.assertEqual(actual_output, str(explicit_output))
 
     def test_current_directory_input_file(self):
         """Test that files in current directory work correctly."""
@@ -128,43 +90,27 @@ monomer2: a* b*
         # Expected output file path (same directory)
         expected_output = Path(self.test_dir) / "current-polymer-basis.tbnpolys"
 
-        # Mock the necessary components
-        with patch("tbnexplorer2.cli.TBNParser") as mock_parser, patch("tbnexplorer2.cli.TBN") as mock_tbn, patch(
-            "tbnexplorer2.cli.NormalizRunner"
-        ) as mock_normaliz, patch("tbnexplorer2.cli.PolymerBasisComputer") as mock_computer:
-            # Set up mocks
-            mock_parser.parse_file.return_value = ([], {}, None, {})
-            mock_tbn_instance = MagicMock()
-            mock_tbn_instance.check_star_limiting.return_value = (True, None)
-            mock_tbn_instance.matrix_A = MagicMock(shape=(0, 0))
-            mock_tbn.return_value = mock_tbn_instance
-
-            mock_normaliz_instance = MagicMock()
-            mock_normaliz_instance.check_normaliz_available.return_value = True
-            mock_normaliz.return_value = mock_normaliz_instance
-
-            mock_computer_instance = MagicMock()
-            mock_computer_instance.compute_polymer_basis.return_value = []
-            mock_computer.return_value = mock_computer_instance
-
-            # Run the CLI with user-friendly flag
-            test_args = ["tbnexplorer2", str(input_file), "--user-friendly-polymer-basis"]
-            with patch("sys.argv", test_args), contextlib.suppress(SystemExit):
-                main()
-
-            # Verify output path
-            mock_computer_instance.save_polymer_basis.assert_called_once()
-            actual_output = mock_computer_instance.save_polymer_basis.call_args[0][1]
-            self.assertEqual(actual_output, str(expected_output))
-
-
-class TestUserFriendlyPolymerBasisFlag(unittest.TestCase):
+        # Run the CLI with user-friendly flag
+        args = _PARSER.parse_args([str(input_file), "--user-friendly-polymer-basis"])
+        with contextlib.suppress(SystemExit):
+            _run(args)
+
+        # Verify output path
+        self.cli.computer_instance.save_polymer_basis.assert_called_once()
+        actual_output = self.cli.computer_instance.save_polymer_basis.call_args[0][1]
+        self.assertEqual(actual_output, str(expected_output))
+
+
+class TestUserFriendlyPolymerBasisFlag(_MockedCLITestCase):
     """Test the --user-friendly-polymer-basis flag behavior."""
 
     def setUp(self):
         """Set up test fixtures."""
-        # Create a temporary directory for tests
-        self.test_dir = tempfile.mkdtemp()
+        super().setUp()
+        # Create a temporary directory for tests, removed on cleanup
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.test_dir = self._tmp.name
 
         # Create a simple valid TBN file content
         self.tbn_content = """# Test TBN file
@@ -175,75 +121,31 @@ monomer2: a* b*
         self.input_file = Path(self.test_dir) / "test.tbn"
         self.input_file.write_text(self.tbn_content)
 
-    def tearDown(self):
-        """Clean up test fixtures."""
-        import shutil
-
-        shutil.rmtree(self.test_dir)
-
     def test_user_friendly_flag_saves_basis_file(self):
         """Test that --user-friendly-polymer-basis flag causes polymer basis file to be saved."""
-        with patch("tbnexplorer2.cli.TBNParser") as mock_parser, patch("tbnexplorer2.cli.TBN") as mock_tbn, patch(
-            "tbnexplorer2.cli.NormalizRunner"
-        ) as mock_normaliz, patch("tbnexplorer2.cli.PolymerBasisComputer") as mock_computer:
-            # Set up mocks
-            mock_parser.parse_file.return_value = ([], {}, None, {})
-            mock_tbn_instance = MagicMock()
-            mock_tbn_instance.check_star_limiting.return_value = (True, None)
-            mock_tbn_instance.matrix_A = MagicMock(shape=(0, 0))
-            mock_tbn_instance.concentrations = None
-            mock_tbn.return_value = mock_tbn_instance
-
-            mock_normaliz_instance = MagicMock()
-            mock_normaliz_instance.check_normaliz_available.return_value = True
-            mock_normaliz.return_value = mock_normaliz_instance
-
-            mock_computer_instance = MagicMock()
-            mock_computer_instance.compute_polymer_basis.return_value = []
-            mock_computer.return_value = mock_computer_instance
-
-            # Run CLI with --user-friendly-polymer-basis flag
-            test_args = ["tbnexplorer2", str(self.input_file), "--user-friendly-polymer-basis"]
-            with patch("sys.argv", test_args), contextlib.suppress(SystemExit):
-                main()
-
-            # Verify that save_polymer_basis was called (user-friendly file should be saved)
-            mock_computer_instance.save_polymer_basis.assert_called_once()
-
-            # Verify that save_tbnpolymat was also called (always saved)
-            mock_computer_instance.save_tbnpolymat.assert_called_once()
+        # Run CLI with --user-friendly-polymer-basis flag
+        args = _PARSER.parse_args([str(self.input_file), "--user-friendly-polymer-basis"])
+        with contextlib.suppress(SystemExit):
+            _run(args)
+
+        # Verify that save_polymer_basis was called (user-friendly file should be saved)
+        self.cli.computer_instance.save_polymer_basis.assert_called_once()
+
+        # Verify that save_tbnpolymat was also called (always saved)
+        self.cli.computer_instance.save_tbnpolymat.assert_called_once()
 
     def test_no_user_friendly_flag_skips_basis_file(self):
         """Test that without --user-friendly-polymer-basis flag, polymer basis file is not saved."""
-        with patch("tbnexplorer2.cli.TBNParser") as mock_parser, patch("tbnexplorer2.cli.TBN") as mock_tbn, patch(
-            "tbnexplorer2.cli.NormalizRunner"
-        ) as mock_normaliz, patch("tbnexplorer2.cli.PolymerBasisComputer") as mock_computer:
-            # Set up mocks
-            mock_parser.parse_file.return_value = ([], {}, None, {})
-            mock_tbn_instance = MagicMock()
-            mock_tbn_instance.check_star_limiting.return_value = (True, None)
-            mock_tbn_instance.matrix_A = MagicMock(shape=(0, 0))
-            mock_tbn_instance.concentrations = None
-            mock_tbn.return_value = mock_tbn_instance
-
-            mock_normaliz_instance = MagicMock()
-            mock_normaliz_instance.check_normaliz_available.return_value = True
-            mock_normaliz.return_value = mock_normaliz_instance
-
-            mock_computer_instance = MagicMock()
-            mock_computer_instance.compute_polymer_basis.return_value = []
-            mock_computer.return_value = mock_computer_instance
-
-            # Run CLI without --user-friendly-polymer-basis flag
-            test_args = ["tbnexplorer2", str(self.input_file)]
-            with patch("sys.argv", test_args), contextlib.suppress(SystemExit):
-                main()
-
-            # Verify that save_polymer_basis was NOT called (no user-friendly file)
-            mock_computer_instance.save_polymer_basis.assert_not_called()
-
-            # Verify that save_tbnpolymat was called (always saved)
-            mock_computer_instance.save_tbnpolymat.assert_called_once()
+        # Run CLI without --user-friendly-polymer-basis flag
+        args = _PARSER.parse_args([str(self.input_file)])
+        with contextlib.suppress(SystemExit):
+            _run(args)
+
+        # Verify that save_polymer_basis was NOT called (no user-friendly file)
+        self.cli.computer_instance.save_polymer_basis.assert_not_called()
+
+        # Verify that save_tbnpolymat was called (always saved)
+        self.cli.computer_instance.save_tbnpolymat.assert_called_once()
 
 
 if __name__ == "__main__":
@@ -1,117 +1,50 @@
-import contextlib
-import os
-import tempfile
-import unittest
-from unittest.mock import MagicMock, patch
-
-from tbnexplorer2.cli import main
-from tbnexplorer2.units import VALID_UNITS
+"""Test cases for CLI concentration units functionality."""
 
+import contextlib
 
-class TestCLIUnits(unittest.TestCase):
-    """Test cases for CLI concentration units functionality."""
+import pytest
 
-    def setUp(self):
-        """Set up test fixtures."""
-        # Create a temporary TBN file with concentrations
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".tbn", delete=False) as temp_file:
-            temp_file.write("""# Test TBN file with concentrations
-\\UNITS: nM
-A: a a*, 100.0
-B: b b*, 50.0
-""")
-            self.temp_filename = temp_file.name
-
-    def tearDown(self):
-        """Clean up test fixtures."""
-        if os.path.exists(self.temp_filename):
-            os.unlink(self.temp_filename)
+from tbnexplorer2.cli import _build_parser, _run, main
+from tbnexplorer2.units import VALID_UNITS
+from tests._cli_fixtures import mocked_cli
 
-    @patch("tbnexplorer2.cli.TBN")
-    @patch("tbnexplorer2.cli.TBNParser.parse_file")
-    @patch("tbnexplorer2.cli.PolymerBasisComputer")
-    @patch("tbnexplorer2.cli.NormalizRunner")
-    def test_default_concentration_units(self, mock_normaliz, mock_computer, mock_parser, mock_tbn):
-        """Test that default concentration units are nM."""
-        # Mock the necessary components
-        mock_parser.return_value = ([], {}, "nM", {})
-        mock_tbn_instance = MagicMock()
-        mock_tbn_instance.check_star_limiting.return_value = (True, None)
-        mock_tbn.return_value = mock_tbn_instance
-        mock_normaliz_instance = MagicMock()
-        mock_normaliz_instance.check_normaliz_available.return_value = True
-        mock_normaliz.return_value = mock_normaliz_instance
-        mock_computer_instance = MagicMock()
-        mock_computer_instance.compute_polymer_basis.return_value = []
-        mock_computer.return_value = mock_computer_instance
 
-        # Test with no units argument (should default to nM)
-        with patch("sys.argv", ["tbnexplorer2", self.temp_filename]), contextlib.suppress(SystemExit):
-            main()  # Expected SystemExit due to mocking
+@pytest.fixture
+def cli_args(tbn_file):
+    """Parsed command-line arguments for running the CLI on tbn_file."""
+    return _build_parser().parse_args([str(tbn_file)])
 
-        # Verify TBN was created with default units
-        mock_tbn.assert_called_once()
-        args, kwargs = mock_tbn.call_args
-        self.assertEqual(kwargs.get("concentration_units"), "nM")
 
-    @patch("tbnexplorer2.cli.TBN")
-    @patch("tbnexplorer2.cli.TBNParser.parse_file")
-    @patch("tbnexplorer2.cli.PolymerBasisComputer")
-    @patch("tbnexplorer2.cli.NormalizRunner")
-    def test_custom_concentration_units(self, mock_normaliz, mock_computer, mock_parser, mock_tbn):
-        """Test setting custom concentration units."""
-        # Mock the necessary components
-        mock_parser.return_value = ([], {}, None, {})
-        mock_tbn_instance = MagicMock()
-        mock_tbn_instance.check_star_limiting.return_value = (True, None)
-        mock_tbn.return_value = mock_tbn_instance
-        mock_normaliz_instance = MagicMock()
-        mock_normaliz_instance.check_normaliz_available.return_value = True
-        mock_normaliz.return_value = mock_normaliz_instance
-        mock_computer_instance = MagicMock()
-        mock_computer_instance.compute_polymer_basis.return_value = []
-        mock_computer.return_value = mock_computer_instance
+def test_default_concentration_units(cli_args):
+    """Test that default concentration units are nM."""
+    with mocked_cli(parse_return=([], {}, "nM", {})) as m, contextlib.suppress(SystemExit):
+        _run(cli_args)  # Expected SystemExit due to mocking
 
-        # Test each valid unit
-        for unit in VALID_UNITS:
-            with self.subTest(unit=unit):
-                # Mock parser to return this specific unit
-                mock_parser.return_value = ([], {}, unit, {})
+    # Verify TBN was created with default units
+    m.tbn.assert_called_once()
+    assert m.tbn.call_args.kwargs.get("concentration_units") == "nM"
 
-                with patch("sys.argv", ["tbnexplorer2", self.temp_filename]), contextlib.suppress(SystemExit):
-                    main()  # Expected SystemExit due to mocking
 
-                # Find the call with the specific unit
-                tbn_calls = mock_tbn.call_args_list
-                found_unit = False
-                for call in tbn_calls:
-                    args, kwargs = call
-                    if kwargs.get("concentration_units") == unit:
-                        found_unit = True
-                        break
+@pytest.mark.parametrize("unit", VALID_UNITS)
+def test_custom_concentration_units(cli_args, unit):
+    """Test setting custom concentration units."""
+    # Mock parser to return this specific unit
+    with mocked_cli(parse_return=([], {}, unit, {})) as m, contextlib.suppress(SystemExit):
+        _run(cli_args)  # Expected SystemExit due to mocking
 
-                self.assertTrue(found_unit, f"TBN was not called with unit {unit}")
+    m.tbn.assert_called_once()
+    assert m.tbn.call_args.kwargs.get("concentration_units") == unit
 
-                # Reset mock for next iteration
-                mock_tbn.reset_mock()
 
-    def test_file_without_units_no_concentrations_allowed(self):
-        """Test that files without UNITS keyword cannot have concentrations."""
-        # Create a temporary file without UNITS but with concentrations
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".tbn", delete=False) as no_units_file:
-            no_units_file.write("""# Test TBN file without UNITS
+def test_file_without_units_no_concentrations_allowed(tmp_path, monkeypatch):
+    """Test that files without UNITS keyword cannot have concentrations."""
+    no_units_file = tmp_path / "no_units.tbn"
+    no_units_file.write_text("""# Test TBN file without UNITS
 A: a a*, 100.0
 B: b b*, 50.0
 """)
-            no_units_filename = no_units_file.name
-
-        try:
-            # This should raise an error
-            with patch("sys.argv", ["tbnexplorer2", no_units_filename]), self.assertRaises(SystemExit):
-                main()
-        finally:
-            os.unlink(no_units_filename)
-
 
-if __name__ == "__main__":
-    unittest.main()
+    # This should raise an error
+    monkeypatch.setattr("sys.argv", ["tbnexplorer2", str(no_units_file)])
+    with pytest.raises(SystemExit):
+        main()
@@ -1,5 +1,4 @@
-import os
-import tempfile
+import io
 from unittest.mock import MagicMock, Mock, patch
 
 import numpy as np
@@ -10,6 +9,49 @@ from tbnexplorer2.coffee import COFFEERunner
 from tbnexplorer2.model import TBN
 from tbnexplorer2.polymer_basis import Polymer
 
+# Monomer count vectors shared by the polymer mocks below; read-only, since tests only read them
+_M1 = np.array([1, 0, 1])
+_M2 = np.array([0, 2, 1])
+_M_ONE = np.array([1])
+_M_FIRST = np.array([1, 0])
+_M_SECOND = np.array([0, 1])
+for _counts in (_M1, _M2, _M_ONE, _M_FIRST, _M_SECOND):
+    _counts.setflags(write=False)
+
+
+@pytest.fixture(autouse=True)
+def mock_subprocess_run(monkeypatch):
+    """Replace subprocess.run in the COFFEE module so no test launches a real process."""
+    mock_run = MagicMock(return_value=Mock(returncode=0))
+    monkeypatch.setattr("tbnexplorer2.coffee.subprocess.run", mock_run)
+    return mock_run
+
+
+@pytest.fixture(scope="module")
+def runner():
+    """Default COFFEERunner shared by tests that only use its file helpers."""
+    return COFFEERunner()
+
+
+@pytest.fixture
+def runner_with_path():
+    """COFFEERunner pointing at a fake coffee-cli path."""
+    return COFFEERunner("/path/to/coffee")
+
+
+@pytest.fixture
+def single_polymer_setup():
+    """A one-monomer TBN mock (100 nM, in Molar) and a single polymer with free energy -1.0."""
+    tbn = Mock(spec=TBN)
+    tbn.concentrations = np.array([1e-7])
+    tbn.concentration_units = "nM"
+
+    polymer = Mock(spec=Polymer)
+    polymer.monomer_counts = _M_ONE
+    polymer.compute_free_energy = Mock(return_value=-1.0)
+    polymer.free_energy = -1.0
+    return tbn, [polymer]
+
 
 class TestCOFFEERunner:
     def test_init_custom_path(self):
@@ -29,11 +71,10 @@ class TestCOFFEERunner:
         runner = COFFEERunner()
         assert runner.temperature == 37.0
 
-    def test_check_coffee_available_exists(self):
+    def test_check_coffee_available_exists(self, runner_with_path):
         """Test check_coffee_available when file exists and is executable."""
-        runner = COFFEERunner("/path/to/coffee")
         with patch("os.path.isfile", return_value=True), patch("os.access", return_value=True):
-            assert runner.check_coffee_available() is True
+            assert runner_with_path.check_coffee_available() is True
 
     def test_check_coffee_available_not_exists(self):
         """Test check_coffee_available when file doesn't exist."""
@@ -41,15 +82,13 @@ class TestCOFFEERunner:
         with patch("os.path.isfile", return_value=False):
             assert runner.check_coffee_available() is False
 
-    def test_check_coffee_available_not_executable(self):
+    def test_check_coffee_available_not_executable(self, runner_with_path):
         """Test check_coffee_available when file exists but not executable."""
-        runner = COFFEERunner("/path/to/coffee")
         with patch("os.path.isfile", return_value=True), patch("os.access", return_value=False):
-            assert runner.check_coffee_available() is False
+            assert runner_with_path.check_coffee_available() is False
 
-    def test_compute_equilibrium_no_concentrations(self):
+    def test_compute_equilibrium_no_concentrations(self, runner):
         """Test compute_equilibrium_concentrations raises error without concentrations."""
-        runner = COFFEERunner()
         tbn = MagicMock(spec=TBN)
         tbn.concentrations = None
         polymers = []
@@ -57,51 +96,42 @@ class TestCOFFEERunner:
         with pytest.raises(ValueError, match="Cannot compute equilibrium concentrations"):
             runner.compute_equilibrium_concentrations(polymers, tbn)
 
-    def test_compute_equilibrium_coffee_not_available(self):
+    def test_compute_equilibrium_coffee_not_available(self, monkeypatch):
         """Test compute_equilibrium_concentrations when COFFEE not available."""
         runner = COFFEERunner("/nonexistent/coffee")
         tbn = MagicMock(spec=TBN)
         tbn.concentrations = np.array([1.0, 2.0])
         polymers = []
 
-        with patch.object(runner, "check_coffee_available", return_value=False):
-            with pytest.raises(RuntimeError, match="COFFEE not found"):
-                runner.compute_equilibrium_concentrations(polymers, tbn)
-
-    def test_write_cfe_file(self):
-        """Test _write_cfe_file method."""
-        runner = COFFEERunner()
+        monkeypatch.setattr(runner, "check_coffee_available", lambda: False)
+        with pytest.raises(RuntimeError, match="COFFEE not found"):
+            runner.compute_equilibrium_concentrations(polymers, tbn)
 
+    def test_write_cfe_stream(self, runner):
+        """Test _write_cfe_stream method."""
         # Create mock polymers
         polymer1 = Mock(spec=Polymer)
-        polymer1.monomer_counts = np.array([1, 0, 1])
+        polymer1.monomer_counts = _M1
         polymer1.compute_free_energy = Mock(return_value=-2.5)
 
         polymer2 = Mock(spec=Polymer)
-        polymer2.monomer_counts = np.array([0, 2, 1])
+        polymer2.monomer_counts = _M2
         polymer2.compute_free_energy = Mock(return_value=-3.0)
 
         polymers = [polymer1, polymer2]
 
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".cfe") as f:
-            filename = f.name
+        buffer = io.StringIO()
+        runner._write_cfe_stream(polymers, buffer)
 
-        try:
-            runner._write_cfe_file(polymers, filename)
+        # Verify the written content
+        lines = buffer.getvalue().splitlines()
 
-            # Read and verify the file
-            with open(filename) as f:
-                lines = f.readlines()
+        assert len(lines) == 2
+        assert lines[0].strip() == "1 0 1 -2.5"
+        assert lines[1].strip() == "0 2 1 -3.0"
 
-            assert len(lines) == 2
-            assert lines[0].strip() == "1 0 1 -2.5"
-            assert lines[1].strip() == "0 2 1 -3.0"
-        finally:
-            os.unlink(filename)
-
-    def test_write_con_file(self):
-        """Test _write_con_file method."""
-        runner = COFFEERunner()
+    def test_write_con_stream(self, runner):
+        """Test _write_con_stream method."""
         tbn = Mock(spec=TBN)
 
         # tbn.concentrations should already return values in Molar units
@@ -109,53 +139,43 @@ class TestCOFFEERunner:
         tbn.concentrations = np.array([1e-7, 5e-8, 2.5e-8])  # Already in Molar
         tbn.concentration_units = "nM"
 
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".con") as f:
-            filename = f.name
+        buffer = io.StringIO()
+        runner._write_con_stream(tbn, buffer)
 
-        try:
-            runner._write_con_file(tbn, filename)
+        # Verify the written content
+        lines = buffer.getvalue().splitlines()
 
-            # Read and verify the file
-            with open(filename) as f:
-                lines = f.readlines()
+        assert len(lines) == 3
+        # Values should be written as-is since they're already in Molar
+        assert float(lines[0].strip()) == pytest.approx(1e-7)
+        assert float(lines[1].strip()) == pytest.approx(5e-8)
+        assert float(lines[2].strip()) == pytest.approx(2.5e-8)
 
-            assert len(lines) == 3
-            # Values should be written as-is since they're already in Molar
-            assert float(lines[0].strip()) == pytest.approx(1e-7)
-            assert float(lines[1].strip()) == pytest.approx(5e-8)
-            assert float(lines[2].strip()) == pytest.approx(2.5e-8)
-        finally:
-            os.unlink(filename)
-
-    def test_parse_coffee_output(self):
+    def test_parse_coffee_output(self, runner, tmp_path):
         """Test _parse_coffee_output method."""
-        runner = COFFEERunner()
-
         # Create sample output file
         output_content = """1.23e-7
 4.56e-8
 0.00e0
 7.89e-9
 """
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-            f.write(output_content)
-            filename = f.name
-
-        try:
-            concentrations = runner._parse_coffee_output(filename)
-
-            assert len(concentrations) == 4
-            assert concentrations[0] == pytest.approx(1.23e-7)
-            assert concentrations[1] == pytest.approx(4.56e-8)
-            assert concentrations[2] == pytest.approx(0.0)
-            assert concentrations[3] == pytest.approx(7.89e-9)
-        finally:
-            os.unlink(filename)
-
-    def test_compute_equilibrium_concentrations_success(self):
-        """Test successful equilibrium concentration computation."""
-        runner = COFFEERunner("/path/to/coffee")
+        filename = tmp_path / "output.txt"
+        filename.write_text(output_content)
+
+        concentrations = runner._parse_coffee_output(str(filename))
+
+        np.testing.assert_allclose(concentrations, [1.23e-7, 4.56e-8, 0.0, 7.89e-9], rtol=1e-7)
 
+    def test_parse_coffee_output_stream(self, runner):
+        """Test _parse_coffee_output_stream on in-memory content."""
+        concentrations = runner._parse_coffee_output_stream(io.StringIO("1.23e-7 4.56e-8\n0.00e0\n"))
+        np.testing.assert_allclose(concentrations, [1.23e-7, 4.56e-8, 0.0])
+
+        with pytest.raises(RuntimeError, match="Cannot parse concentration value: nan-ish"):
+            runner._parse_coffee_output_stream(io.StringIO("1.0e-7\nnan-ish\n"))
+
+    def test_compute_equilibrium_concentrations_success(self, runner_with_path, monkeypatch, mock_subprocess_run):
+        """Test successful equilibrium concentration computation."""
         # Mock TBN
         tbn = Mock(spec=TBN)
         tbn.concentrations = np.array([1e-7, 5e-8])  # Already in Molar (equivalent to 100 nM, 50 nM)
@@ -163,126 +183,90 @@ class TestCOFFEERunner:
 
         # Mock polymers
         polymer1 = Mock(spec=Polymer)
-        polymer1.monomer_counts = np.array([1, 0])
+        polymer1.monomer_counts = _M_FIRST
         polymer1.free_energy = -1.0
+        polymer1.compute_free_energy = Mock(return_value=-1.0)
 
         polymer2 = Mock(spec=Polymer)
-        polymer2.monomer_counts = np.array([0, 1])
+        polymer2.monomer_counts = _M_SECOND
         polymer2.free_energy = -2.0
+        polymer2.compute_free_energy = Mock(return_value=-2.0)
 
         polymers = [polymer1, polymer2]
 
-        # Mock the subprocess call
-        mock_result = Mock()
-        mock_result.returncode = 0
-
         # Mock output file content
         expected_concentrations = np.array([1.5e-7, 2.3e-8])
 
-        with patch.object(runner, "check_coffee_available", return_value=True), patch(
-            "tbnexplorer2.coffee.subprocess.run", return_value=mock_result
-        ) as mock_run, patch.object(runner, "_parse_coffee_output", return_value=expected_concentrations):
-            result = runner.compute_equilibrium_concentrations(polymers, tbn)
+        monkeypatch.setattr(runner_with_path, "check_coffee_available", lambda: True)
+        monkeypatch.setattr(runner_with_path, "_parse_coffee_output", lambda filepath: expected_concentrations)
 
-            # Verify subprocess was called WITHOUT temperature parameter (default 37°C)
-            assert mock_run.called
-            call_args = mock_run.call_args[0][0]  # Get the command list
-            assert "--temp" not in call_args  # Should not include --temp for default
+        result = runner_with_path.compute_equilibrium_concentrations(polymers, tbn)
 
-            # Verify result
-            np.testing.assert_array_almost_equal(result, expected_concentrations)
+        # Verify subprocess was called WITHOUT temperature parameter (default 37°C)
+        assert mock_subprocess_run.called
+        call_args = mock_subprocess_run.call_args[0][0]  # Get the command list
+        assert "--temp" not in call_args  # Should not include --temp for default
 
-    def test_compute_equilibrium_concentrations_coffee_error(self):
-        """Test error handling when COFFEE fails."""
-        runner = COFFEERunner("/path/to/coffee")
+        # Verify result
+        np.testing.assert_array_almost_equal(result, expected_concentrations)
 
-        tbn = Mock(spec=TBN)
-        tbn.concentrations = np.array([1e-7])  # Already in Molar (equivalent to 100 nM)
-        tbn.concentration_units = "nM"
-
-        polymer = Mock(spec=Polymer)
-        polymer.monomer_counts = np.array([1])
-        polymer.free_energy = -1.0
-        polymers = [polymer]
+    def test_compute_equilibrium_concentrations_coffee_error(
+        self, runner_with_path, single_polymer_setup, monkeypatch, mock_subprocess_run
+    ):
+        """Test error handling when COFFEE fails."""
+        tbn, polymers = single_polymer_setup
 
         # Mock subprocess to return error
         mock_result = Mock()
         mock_result.returncode = 1
         mock_result.stderr = "COFFEE error message"
+        mock_subprocess_run.return_value = mock_result
 
-        with patch.object(runner, "check_coffee_available", return_value=True), patch(
-            "tbnexplorer2.coffee.subprocess.run", return_value=mock_result
-        ):
-            with pytest.raises(RuntimeError, match="COFFEE failed"):
-                runner.compute_equilibrium_concentrations(polymers, tbn)
+        monkeypatch.setattr(runner_with_path, "check_coffee_available", lambda: True)
 
-    def test_compute_equilibrium_with_temperature(self):
+        with pytest.raises(RuntimeError, match="COFFEE failed"):
+            runner_with_path.compute_equilibrium_concentrations(polymers, tbn)
+
+    def test_compute_equilibrium_with_temperature(self, single_polymer_setup, monkeypatch, mock_subprocess_run):
         """Test that non-default temperature parameter is passed to coffee-cli."""
         runner = COFFEERunner("/path/to/coffee", temperature=25.0)  # Non-default temperature
-
-        # Mock TBN
-        tbn = Mock(spec=TBN)
-        tbn.concentrations = np.array([1e-7])
-        tbn.concentration_units = "nM"
-
-        # Mock polymer
-        polymer = Mock(spec=Polymer)
-        polymer.monomer_counts = np.array([1])
-        polymer.compute_free_energy = Mock(return_value=-1.0)
-        polymers = [polymer]
-
-        # Mock successful subprocess result
-        mock_result = Mock()
-        mock_result.returncode = 0
+        tbn, polymers = single_polymer_setup
 
         expected_concentrations = np.array([1.5e-7])
 
-        with patch.object(runner, "check_coffee_available", return_value=True), patch(
-            "tbnexplorer2.coffee.subprocess.run", return_value=mock_result
-        ) as mock_run, patch.object(runner, "_parse_coffee_output", return_value=expected_concentrations):
-            result = runner.compute_equilibrium_concentrations(polymers, tbn)
-
-            # Verify subprocess was called with temperature parameter
-            assert mock_run.called
-            call_args = mock_run.call_args[0][0]  # Get the command list
-            assert "--temp" in call_args
-            temp_index = call_args.index("--temp")
-            assert call_args[temp_index + 1] == "25.0"  # Non-default temperature
+        monkeypatch.setattr(runner, "check_coffee_available", lambda: True)
+        monkeypatch.setattr(runner, "_parse_coffee_output", lambda filepath: expected_concentrations)
 
-            # Verify result
-            np.testing.assert_array_almost_equal(result, expected_concentrations)
-
-    def test_compute_equilibrium_default_temp_no_param(self):
-        """Test that default temperature (37°C) does NOT pass --temp parameter for backward compatibility."""
-        runner = COFFEERunner("/path/to/coffee")  # Uses default 37°C
-        assert runner.temperature == 37.0
+        result = runner.compute_equilibrium_concentrations(polymers, tbn)
 
-        # Mock TBN
-        tbn = Mock(spec=TBN)
-        tbn.concentrations = np.array([1e-7])
-        tbn.concentration_units = "nM"
+        # Verify subprocess was called with temperature parameter
+        assert mock_subprocess_run.called
+        call_args = mock_subprocess_run.call_args[0][0]  # Get the command list
+        assert "--temp" in call_args
+        temp_index = call_args.index("--temp")
+        assert call_args[temp_index + 1] == "25.0"  # Non-default temperature
 
-        # Mock polymer
-        polymer = Mock(spec=Polymer)
-        polymer.monomer_counts = np.array([1])
-        polymer.compute_free_energy = Mock(return_value=-1.0)
-        polymers = [polymer]
+        # Verify result
+        np.testing.assert_array_almost_equal(result, expected_concentrations)
 
-        # Mock successful subprocess result
-        mock_result = Mock()
-        mock_result.returncode = 0
+    def test_compute_equilibrium_default_temp_no_param(
+        self, runner_with_path, single_polymer_setup, monkeypatch, mock_subprocess_run
+    ):
+        """Test that default temperature (37°C) does NOT pass --temp parameter for backward compatibility."""
+        assert runner_with_path.temperature == 37.0
+        tbn, polymers = single_polymer_setup
 
         expected_concentrations = np.array([1.5e-7])
 
-        with patch.object(runner, "check_coffee_available", return_value=True), patch(
-            "tbnexplorer2.coffee.subprocess.run", return_value=mock_result
-        ) as mock_run, patch.object(runner, "_parse_coffee_output", return_value=expected_concentrations):
-            result = runner.compute_equilibrium_concentrations(polymers, tbn)
+        monkeypatch.setattr(runner_with_path, "check_coffee_available", lambda: True)
+        monkeypatch.setattr(runner_with_path, "_parse_coffee_output", lambda filepath: expected_concentrations)
+
+        result = runner_with_path.compute_equilibrium_concentrations(polymers, tbn)
 
-            # Verify subprocess was called WITHOUT --temp parameter (backward compatibility)
-            assert mock_run.called
-            call_args = mock_run.call_args[0][0]  # Get the command list
-            assert "--temp" not in call_args  # Should not include --temp for default 37°C
+        # Verify subprocess was called WITHOUT --temp parameter (backward compatibility)
+        assert mock_subprocess_run.called
+        call_args = mock_subprocess_run.call_args[0][0]  # Get the command list
+        assert "--temp" not in call_args  # Should not include --temp for default 37°C
 
-            # Verify result
-            np.testing.assert_array_almost_equal(result, expected_concentrations)
+        # Verify result
+        np.testing.assert_array_almost_equal(result, expected_concentrations)
@@ -1,33 +1,73 @@
-import os
-from unittest.mock import patch
+import pytest
 
 from tbnexplorer2 import config
 
 
 class TestConfig:
-    def test_normaliz_path_from_env(self):
-        """Test NORMALIZ_PATH from environment variable."""
-        test_path = "/custom/path/to/normaliz"
-        with patch.dict(os.environ, {"NORMALIZ_PATH": test_path}):
-            import importlib
-
-            importlib.reload(config)
-            assert test_path == config.NORMALIZ_PATH
-
-    def test_coffee_cli_path_from_env(self):
-        """Test COFFEE_CLI_PATH from environment variable."""
-        test_path = "/custom/path/to/coffee-cli"
-        with patch.dict(os.environ, {"COFFEE_CLI_PATH": test_path}):
-            import importlib
-
-            importlib.reload(config)
-            assert test_path == config.COFFEE_CLI_PATH
-
-    def test_fourti2_path_from_env(self):
-        """Test FOURTI2_PATH from environment variable."""
-        test_path = "/custom/path/to/4ti2"
-        with patch.dict(os.environ, {"FOURTI2_PATH": test_path}):
-            import importlib
-
-            importlib.reload(config)
-            assert test_path == config.FOURTI2_PATH
+    @pytest.mark.parametrize(
+        "env_var,value",
+        [
+            ("NORMALIZ_PATH", "/custom/path/to/normaliz"),
+            ("COFFEE_CLI_PATH", "/custom/path/to/coffee-cli"),
+            ("FOURTI2_PATH", "/custom/path/to/4ti2"),
+            ("NUPACK_CONCENTRATIONS_PATH", "/custom/path/to/concentrations"),
+        ],
+    )
+    def test_path_from_env(self, env_var, value):
+        """Test that each tool path can be set from its environment variable."""
+        cfg = config.load_config({env_var: value})
+        assert getattr(cfg, env_var) == value
+
+    def test_refresh(self, monkeypatch):
+        """Test that refresh() reassigns the module constants from the environment."""
+        monkeypatch.setenv("NORMALIZ_PATH", "/custom/path/to/normaliz")
+        config.refresh()
+        try:
+            assert config.NORMALIZ_PATH == "/custom/path/to/normaliz"
+        finally:
+            monkeypatch.undo()
+            config.refresh()
+        assert config.NORMALIZ_PATH == config.load_config().NORMALIZ_PATH
+
+    def test_defaults(self):
+        """Test the default tool names when no environment variables are set."""
+        cfg = config.load_config({})
+        assert cfg.NORMALIZ_PATH == "normaliz"
+        assert cfg.COFFEE_CLI_PATH == "coffee-cli"
+        assert cfg.FOURTI2_PATH == "4ti2"
+        assert cfg.NUPACK_CONCENTRATIONS_PATH == "concentrations"
+
+    @pytest.mark.parametrize(
+        "content,expected",
+        [
+            (
+                "NORMALIZ_PATH=/opt/normaliz\nCOFFEE_CLI_PATH=/opt/coffee-cli\n",
+                {
+                    "NORMALIZ_PATH": "/opt/normaliz",
+                    "COFFEE_CLI_PATH": "/opt/coffee-cli",
+                },
+            ),
+            ("# Tool paths\n\n  FOURTI2_PATH = /opt/4ti2  \n#NORMALIZ_PATH=/ignored\n", {"FOURTI2_PATH": "/opt/4ti2"}),
+        ],
+    )
+    def test_env_file(self, tmp_path, content, expected):
+        """Test loading a .env file, skipping comments and blank lines and stripping whitespace."""
+        env_file = tmp_path / ".env"
+        env_file.write_text(content)
+
+        environ = {}
+        config.load_env_file(env_file, environ)
+        assert environ == expected
+
+    def test_env_file_does_not_override(self, tmp_path):
+        """Test that variables already set take precedence over the .env file."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("NORMALIZ_PATH=/from/env-file\n")
+
+        environ = {"NORMALIZ_PATH": "/from/environment"}
+        config.load_env_file(env_file, environ)
+        assert environ == {"NORMALIZ_PATH": "/from/environment"}
+
+        # A missing file is ignored
+        config.load_env_file(tmp_path / "missing.env", environ)
+        assert environ == {"NORMALIZ_PATH": "/from/environment"}
@@ -1,220 +1,123 @@
 """Tests for constraints file functionality in tbnexplorer2-filter."""
 
-import os
+import contextlib
+import io
 import subprocess
-import sys
-import tempfile
-from pathlib import Path
+
+import pytest
+
+from tbnexplorer2 import filter_cli
+
+# Built once per process; tests run the filter directly on parsed Namespaces
+_PARSER = filter_cli._build_parser()
+
+# Monomers 5 and 6 are unnamed
+_TBN_CONTENT = """\\UNITS: nM
+a b >M1, 100
+a* b* >M2, 100
+c d >M3, 100
+c* d* >M4, 100
+a a b b, 50
+c c d d, 50
+"""
+
+# Polymers: 1 = M1 + M2 dimer, 2 = M3 + M4 dimer, 3 = just M1, 4 = just M3,
+# 5 = M1 + M3, 6 = unnamed monomer (a a b b)
+_POLYMAT_CONTENT = """# TBN Polymer Matrix
+# Number of polymers: 6
+# Number of monomers: 6
+\\MATRIX-HASH: test_hash
+# Concentration units: nanoMolar (nM)
+# Columns: monomer_counts[1..6] free_energy concentration
+#
+1 1 0 0 0 0 -2.0 50.0
+0 0 1 1 0 0 -2.0 40.0
+1 0 0 0 0 0 0.0 30.0
+0 0 1 0 0 0 0.0 20.0
+1 0 1 0 0 0 0.0 10.0
+0 0 0 0 1 0 0.0 5.0
+"""
+
+
+@pytest.fixture(scope="class")
+def tbn_files(tmp_path_factory):
+    """Write the test TBN file and its .tbnpolymat once per test class."""
+    directory = tmp_path_factory.mktemp("constraints")
+    tbn_path = directory / "test.tbn"
+    polymat_path = directory / "test.tbnpolymat"
+    tbn_path.write_text(_TBN_CONTENT)
+    polymat_path.write_text(_POLYMAT_CONTENT)
+    return tbn_path, polymat_path
 
 
 class TestConstraintsFile:
     """Test constraints file functionality."""
 
-    def setup_method(self):
-        """Create temporary test files."""
-        # Create a simple TBN file with units and concentrations
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".tbn", delete=False) as test_tbn:
-            test_tbn.write("\\UNITS: nM\n")
-            test_tbn.write("a b >M1, 100\n")
-            test_tbn.write("a* b* >M2, 100\n")
-            test_tbn.write("c d >M3, 100\n")
-            test_tbn.write("c* d* >M4, 100\n")
-            test_tbn.write("a a b b, 50\n")  # Unnamed monomer
-            test_tbn.write("c c d d, 50\n")  # Another unnamed monomer
-            self.test_tbn_name = test_tbn.name
-
-        # Create corresponding polymat file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".tbnpolymat", delete=False):
-            base_name = Path(self.test_tbn_name).stem
-            self.test_polymat_path = Path(self.test_tbn_name).parent / f"{base_name}.tbnpolymat"
-
-        # Write polymat content
-        with open(self.test_polymat_path, "w") as f:
-            f.write("# TBN Polymer Matrix\n")
-            f.write("# Number of polymers: 6\n")
-            f.write("# Number of monomers: 6\n")
-            f.write("\\MATRIX-HASH: test_hash\n")
-            f.write("# Concentration units: nanoMolar (nM)\n")
-            f.write("# Columns: monomer_counts[1..6] free_energy concentration\n")
-            f.write("#\n")
-            # Polymer 1: M1 + M2 dimer
-            f.write("1 1 0 0 0 0 -2.0 50.0\n")
-            # Polymer 2: M3 + M4 dimer
-            f.write("0 0 1 1 0 0 -2.0 40.0\n")
-            # Polymer 3: Just M1
-            f.write("1 0 0 0 0 0 0.0 30.0\n")
-            # Polymer 4: Just M3
-            f.write("0 0 1 0 0 0 0.0 20.0\n")
-            # Polymer 5: M1 + M3
-            f.write("1 0 1 0 0 0 0.0 10.0\n")
-            # Polymer 6: Unnamed monomer (a a b b)
-            f.write("0 0 0 0 1 0 0.0 5.0\n")
-
-    def teardown_method(self):
-        """Clean up temporary files."""
-        try:
-            os.unlink(self.test_tbn_name)
-            os.unlink(self.test_polymat_path)
-        except Exception:
-            pass
-
     def run_filter(self, args):
-        """Run tbnexplorer2-filter with given arguments."""
-        cmd = [sys.executable, "-m", "tbnexplorer2.filter_cli", *args]
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        return result
-
-    def test_contains_single_constraint(self):
-        """Test CONTAINS constraint with single monomer."""
-        # Create constraints file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("CONTAINS M1\n")
-            constraints_file = f.name
-
-        try:
-            result = self.run_filter([self.test_tbn_name, "--constraints-file", constraints_file])
-            assert result.returncode == 0
-            assert "M1" in result.stdout
-            # Should match polymers 1, 3, and 5
-            assert "# Number of matching polymers: 3" in result.stdout
-        finally:
-            os.unlink(constraints_file)
-
-    def test_contains_multiple_monomers(self):
-        """Test CONTAINS constraint with multiple monomers."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("CONTAINS M1 M2\n")
-            constraints_file = f.name
-
-        try:
-            result = self.run_filter([self.test_tbn_name, "--constraints-file", constraints_file])
-            assert result.returncode == 0
-            # Should only match polymer 1 (M1 + M2 dimer)
-            assert "# Number of matching polymers: 1" in result.stdout
-        finally:
-            os.unlink(constraints_file)
-
-    def test_exactly_constraint(self):
-        """Test EXACTLY constraint."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("EXACTLY M1\n")
-            constraints_file = f.name
-
-        try:
-            result = self.run_filter([self.test_tbn_name, "--constraints-file", constraints_file])
-            assert result.returncode == 0
-            # Should only match polymer 3 (just M1)
-            assert "# Number of matching polymers: 1" in result.stdout
-            assert "M1" in result.stdout
-        finally:
-            os.unlink(constraints_file)
-
-    def test_or_logic_multiple_constraints(self):
-        """Test OR logic with multiple constraints."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("EXACTLY M1\n")
-            f.write("EXACTLY M3\n")
-            constraints_file = f.name
-
-        try:
-            result = self.run_filter([self.test_tbn_name, "--constraints-file", constraints_file])
-            assert result.returncode == 0
-            # Should match polymers 3 (just M1) and 4 (just M3)
-            assert "# Number of matching polymers: 2" in result.stdout
-        finally:
-            os.unlink(constraints_file)
-
-    def test_constraints_with_nonexistent_monomer(self):
-        """Test constraints with monomer name that doesn't exist."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("CONTAINS NonExistentMonomer\n")
-            constraints_file = f.name
-
-        try:
-            result = self.run_filter([self.test_tbn_name, "--constraints-file", constraints_file])
-            assert result.returncode == 0
-            # Should match no polymers
-            assert "# Number of matching polymers: 0" in result.stdout
-        finally:
-            os.unlink(constraints_file)
-
-    def test_empty_constraints_file(self):
-        """Test empty constraints file returns all polymers."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("# Just comments\n")
-            f.write("\n")
-            constraints_file = f.name
-
-        try:
-            result = self.run_filter([self.test_tbn_name, "--constraints-file", constraints_file])
-            assert result.returncode == 0
-            # Should return all polymers
-            assert "# Number of matching polymers: 6" in result.stdout
-        finally:
-            os.unlink(constraints_file)
-
-    def test_invalid_constraint_type(self):
+        """Run tbnexplorer2-filter in-process with given arguments, capturing its output."""
+        stdout, stderr = io.StringIO(), io.StringIO()
+        returncode = 0
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                filter_cli._run(_PARSER.parse_args(args))
+            except SystemExit as e:
+                returncode = e.code if isinstance(e.code, int) else int(e.code is not None)
+        return subprocess.CompletedProcess(args, returncode, stdout.getvalue(), stderr.getvalue())
+
+    @pytest.mark.parametrize(
+        "constraints_data,extra_args,expected_count,expected_fragments",
+        [
+            # CONTAINS with a single monomer matches polymers 1, 3 and 5
+            (b"CONTAINS M1\n", [], 3, ["M1"]),
+            # CONTAINS with multiple monomers only matches polymer 1 (M1 + M2 dimer)
+            (b"CONTAINS M1 M2\n", [], 1, []),
+            # EXACTLY only matches polymer 3 (just M1)
+            (b"EXACTLY M1\n", [], 1, ["M1"]),
+            # Multiple constraints are ORed: polymers 3 (just M1) and 4 (just M3)
+            (b"EXACTLY M1\nEXACTLY M3\n", [], 2, []),
+            # A monomer name that doesn't exist matches nothing
+            (b"CONTAINS NonExistentMonomer\n", [], 0, []),
+            # An empty constraints file returns all polymers
+            (b"# Just comments\n\n", [], 6, []),
+            # Total concentration is 155 nM, so > 20% means > 31 nM: only polymer 1 (50.0)
+            (b"CONTAINS M1\n", ["--percent-limit", "20"], 1, []),
+            # The --num limit caps the output at 2 polymers
+            (b"CONTAINS M1\nCONTAINS M3\n", ["--num", "2"], 2, ["# Maximum count limit: 2"]),
+        ],
+    )
+    def test_constraints_matching(
+        self, tbn_files, tmp_path, constraints_data, extra_args, expected_count, expected_fragments
+    ):
+        """Test CONTAINS/EXACTLY constraints files, alone and with output limits."""
+        constraints_file = tmp_path / "constraints.txt"
+        constraints_file.write_bytes(constraints_data)
+
+        result = self.run_filter([str(tbn_files[0]), "--constraints-file", str(constraints_file), *extra_args])
+        assert result.returncode == 0
+        assert f"# Number of matching polymers: {expected_count}" in result.stdout
+        for fragment in expected_fragments:
+            assert fragment in result.stdout
+
+    def test_invalid_constraint_type(self, tbn_files, tmp_path):
         """Test error handling for invalid constraint type."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("INCLUDES M1\n")  # Invalid - should be CONTAINS
-            constraints_file = f.name
-
-        try:
-            result = self.run_filter([self.test_tbn_name, "--constraints-file", constraints_file])
-            assert result.returncode != 0
-            assert "Invalid constraint type 'INCLUDES'" in result.stderr
-        finally:
-            os.unlink(constraints_file)
-
-    def test_constraints_file_with_command_line_monomers(self):
+        constraints_file = tmp_path / "constraints.txt"
+        constraints_file.write_bytes(b"INCLUDES M1\n")  # Invalid - should be CONTAINS
+
+        result = self.run_filter([str(tbn_files[0]), "--constraints-file", str(constraints_file)])
+        assert result.returncode != 0
+        assert "Invalid constraint type 'INCLUDES'" in result.stderr
+
+    def test_constraints_file_with_command_line_monomers(self, tbn_files, tmp_path):
         """Test error when specifying both constraints file and command line monomers."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("CONTAINS M1\n")
-            constraints_file = f.name
-
-        try:
-            result = self.run_filter([self.test_tbn_name, "M1", "--constraints-file", constraints_file])
-            assert result.returncode != 0
-            assert "Cannot specify monomer names on command line when using --constraints-file" in result.stderr
-        finally:
-            os.unlink(constraints_file)
-
-    def test_nonexistent_constraints_file(self):
+        constraints_file = tmp_path / "constraints.txt"
+        constraints_file.write_bytes(b"CONTAINS M1\n")
+
+        result = self.run_filter([str(tbn_files[0]), "M1", "--constraints-file", str(constraints_file)])
+        assert result.returncode != 0
+        assert "Cannot specify monomer names on command line when using --constraints-file" in result.stderr
+
+    def test_nonexistent_constraints_file(self, tbn_files):
         """Test error handling for nonexistent constraints file."""
-        result = self.run_filter([self.test_tbn_name, "--constraints-file", "nonexistent.txt"])
+        result = self.run_filter([str(tbn_files[0]), "--constraints-file", "nonexistent.txt"])
         assert result.returncode != 0
         assert "Constraints file 'nonexistent.txt' not found" in result.stderr
-
-    def test_constraints_with_percent_limit(self):
-        """Test constraints file with percent limit."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("CONTAINS M1\n")
-            constraints_file = f.name
-
-        try:
-            result = self.run_filter(
-                [self.test_tbn_name, "--constraints-file", constraints_file, "--percent-limit", "20"]
-            )
-            assert result.returncode == 0
-            # With percent limit, should only show polymers > 20% of total
-            # Total concentration is 155, so > 31 nM
-            # Only polymer 1 (50.0) should match
-            assert "# Number of matching polymers: 1" in result.stdout
-        finally:
-            os.unlink(constraints_file)
-
-    def test_constraints_with_num_limit(self):
-        """Test constraints file with num limit."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("CONTAINS M1\n")
-            f.write("CONTAINS M3\n")
-            constraints_file = f.name
-
-        try:
-            result = self.run_filter([self.test_tbn_name, "--constraints-file", constraints_file, "--num", "2"])
-            assert result.returncode == 0
-            # Should limit to 2 polymers
-            assert "# Maximum count limit: 2" in result.stdout
-            assert "# Number of matching polymers: 2" in result.stdout
-        finally:
-            os.unlink(constraints_file)
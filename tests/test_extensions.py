@@ -1,11 +1,14 @@
 """Tests for the extensions module."""
 
-import tempfile
+import contextlib
+import io
 from pathlib import Path
+from types import SimpleNamespace
 
 import numpy as np
 import pytest
 
+from extensions import ibot_cli
 from extensions.canonical_reactions import CanonicalReactionsComputer, Reaction
 from extensions.ibot import IBOTAlgorithm
 from tbnexplorer2.model import TBN, BindingSite, Monomer
@@ -13,8 +16,9 @@ from tbnexplorer2.parser import TBNParser
 from tbnexplorer2.polymer_basis import PolymerBasisComputer
 
 
-def create_test_tbn():
-    """Create a simple TBN for testing."""
+@pytest.fixture(scope="module")
+def tbn():
+    """A simple three-monomer TBN shared by the tests in this module (tests must not mutate it)."""
     binding_sites = {"a": 0, "b": 1, "c": 2}
 
     monomers = [
@@ -47,33 +51,63 @@ class TestCanonicalReactions:
     def test_reaction_balanced(self):
         """Test reaction balance checking."""
         # Balanced reaction: 2A -> B + C (2 reactants, 2 products)
-        reaction_vec = np.array([-2, 1, 1, 0])
+        reaction_vec = np.array([-2, 1, 1, 0], dtype=np.int8)
         reaction = Reaction(reaction_vec)
         assert reaction.is_balanced()
 
         # Unbalanced reaction: A -> B + C (1 reactant, 2 products)
-        reaction_vec = np.array([-1, 1, 1, 0])
+        reaction_vec = np.array([-1, 1, 1, 0], dtype=np.int8)
         reaction = Reaction(reaction_vec)
         assert not reaction.is_balanced()
 
+        # Multiplicities beyond the int8 range must not wrap around
+        reaction_vec = np.array([-100, -100, 100, 100], dtype=np.int8)
+        assert Reaction(reaction_vec).is_balanced()
+        reaction_vec = np.array([-100, -100, -100, 44], dtype=np.int8)  # 300 wraps to 44 in int8
+        assert not Reaction(reaction_vec).is_balanced()
+
+    def test_reactions_are_balanced(self):
+        """Test the batched balance check against is_balanced."""
+        vectors = np.array(
+            [[-2, 1, 1, 0], [-1, 1, 1, 0], [-100, -100, 100, 100], [-100, -100, -100, 44]],
+            dtype=np.int8,
+        )
+        expected = [Reaction(vector).is_balanced() for vector in vectors]
+        assert Reaction.are_balanced(vectors).tolist() == expected == [True, False, True, False]
+
+    def test_on_target_detailed_balance(self, tbn):
+        """Test finding the first unbalanced reaction over on-target polymers only."""
+        computer = CanonicalReactionsComputer(tbn)
+        computer.setup_matrices(np.eye(3, dtype=np.int8), on_target_indices={0, 1})
+
+        balanced = Reaction(np.array([-1, 1, 0], dtype=np.int8))
+        with_off_target = Reaction(np.array([-1, 0, 2], dtype=np.int8))  # Unbalanced, but produces P2
+        unbalanced = Reaction(np.array([-2, 1, 0], dtype=np.int8))
+
+        assert computer.check_on_target_detailed_balance([]) is None
+        assert computer.check_on_target_detailed_balance([balanced, with_off_target]) is None
+        assert computer.check_on_target_detailed_balance([balanced, with_off_target, unbalanced]) is unbalanced
+
     def test_reaction_string_representation(self):
         """Test reaction string formatting."""
-        reaction_vec = np.array([-1, -1, 2, 0])
+        reaction_vec = np.array([-1, -1, 2, 0], dtype=np.int8)
         reaction = Reaction(reaction_vec, polymer_names=["A", "B", "C", "D"])
         assert str(reaction) == "A + B -> 2 C"
 
-    def test_setup_matrices(self):
+    def test_setup_matrices(self, tbn):
         """Test B and S matrix setup."""
-        tbn = create_test_tbn()
         computer = CanonicalReactionsComputer(tbn)
 
         # Create mock polymer basis
-        polymers = [
-            np.array([1, 0, 0]),  # Just M1
-            np.array([0, 1, 0]),  # Just M2
-            np.array([0, 0, 1]),  # Just M3
-            np.array([1, 1, 0]),  # M1 + M2
-        ]
+        polymers = np.array(
+            [
+                [1, 0, 0],  # Just M1
+                [0, 1, 0],  # Just M2
+                [0, 0, 1],  # Just M3
+                [1, 1, 0],  # M1 + M2
+            ],
+            dtype=np.int8,
+        )
 
         on_target_indices = {0, 1}  # First two polymers are on-target
 
@@ -89,18 +123,119 @@ class TestCanonicalReactions:
         assert computer.S_matrix[0, 2] == 1  # Selects polymer 2
         assert computer.S_matrix[1, 3] == 1  # Selects polymer 3
 
+        # B columns are the polymers; a list of vectors gives the same matrix
+        np.testing.assert_array_equal(computer.B_matrix, polymers.T)
+        assert computer.B_matrix.dtype == np.int8
+        computer.setup_matrices(list(polymers), on_target_indices)
+        np.testing.assert_array_equal(computer.B_matrix, polymers.T)
+
+
+@pytest.fixture(scope="module")
+def initial_ibot(tbn):
+    """IBOT over three single-monomer polymers with P0 on-target, before run() (tests must not mutate it)."""
+    polymers = [
+        np.array([1, 0, 0], dtype=np.int8),
+        np.array([0, 1, 0], dtype=np.int8),
+        np.array([0, 0, 1], dtype=np.int8),
+    ]
+    return IBOTAlgorithm(tbn, polymers, on_target_indices={0}, reactions=[])
+
+
+# Named monomers A, B, C, D; A+B and C+D are the fully bound dimers
+_LOOKUP_TBN = """A: a b
+B: a* b*
+C: c
+D: c*
+"""
+
+# Basis as int32 count vectors; the A+B dimer appears twice and the first occurrence (index 2) wins
+_LOOKUP_BASIS = np.array(
+    [[1, 0, 0, 0], [0, 1, 0, 0], [1, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1], [1, 1, 0, 0]],
+    dtype=np.int32,
+)
+
+
+@pytest.fixture
+def lookup_tbn_path(tmp_path):
+    """Write the four-monomer lookup TBN to tmp_path."""
+    tbn_path = tmp_path / "lookup.tbn"
+    tbn_path.write_text(_LOOKUP_TBN)
+    return tbn_path
+
+
+class TestOnTargetLookup:
+    """Test matching .tbnpolys polymers against the polymer basis."""
+
+    def test_load_on_target_polymers(self, lookup_tbn_path, tmp_path):
+        """Test on-target lookup with a duplicated polymer and an int32 basis."""
+        monomers, binding_site_index, concentration_units, _ = TBNParser.parse_file(str(lookup_tbn_path))
+        computer = CanonicalReactionsComputer(TBN(monomers, binding_site_index, concentration_units))
+
+        # A+B is listed twice and is also duplicated in the basis; C is a monomer on its own
+        on_target_path = tmp_path / "on-target.tbnpolys"
+        on_target_path.write_text("A\nB\n\nB\nA\n\nC\n")
+
+        assert computer.load_on_target_polymers(on_target_path, list(_LOOKUP_BASIS)) == {2, 3}
+
+    def test_load_on_target_polymer_not_in_basis(self, lookup_tbn_path, tmp_path):
+        """Test that an on-target polymer missing from the basis raises ValueError."""
+        monomers, binding_site_index, concentration_units, _ = TBNParser.parse_file(str(lookup_tbn_path))
+        computer = CanonicalReactionsComputer(TBN(monomers, binding_site_index, concentration_units))
+
+        on_target_path = tmp_path / "on-target.tbnpolys"
+        on_target_path.write_text("C\nD\n")  # The C+D dimer is not in _LOOKUP_BASIS
+
+        with pytest.raises(ValueError, match="not found in polymer basis"):
+            computer.load_on_target_polymers(on_target_path, list(_LOOKUP_BASIS))
+
+    def test_ibot_cli_upper_bound_targets(self, lookup_tbn_path, tmp_path, monkeypatch):
+        """Test that ibot_cli maps upper-bound targets to basis indices and warns about unknown ones."""
+        polymers = [SimpleNamespace(monomer_counts=counts) for counts in _LOOKUP_BASIS]
+        monkeypatch.setattr(
+            ibot_cli,
+            "PolymerBasisComputer",
+            lambda *args, **kwargs: SimpleNamespace(compute_polymer_basis=lambda: polymers),
+        )
+        requested_targets = []
+
+        def compute_for_targets(self, target_polymer_indices):
+            requested_targets.append(target_polymer_indices)
+            return []
+
+        monkeypatch.setattr(
+            CanonicalReactionsComputer, "compute_irreducible_canonical_reactions_for_targets", compute_for_targets
+        )
+
+        on_target_path = tmp_path / "on-target.tbnpolys"
+        on_target_path.write_text("A\nB\n")
+        # The monomer D is in the basis (index 4); the C+D dimer is not
+        upper_bound_path = tmp_path / "upper-bound.tbnpolys"
+        upper_bound_path.write_text("D\n\nC\nD\n")
+
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            ibot_cli.main(
+                [
+                    str(lookup_tbn_path),
+                    str(on_target_path),
+                    "--upper-bound-on-polymers",
+                    str(upper_bound_path),
+                    "--output-prefix",
+                    str(tmp_path / "lookup"),
+                ]
+            )
+
+        assert requested_targets == [{4}]
+        assert "Warning: Target polymer [0 0 1 1] not found in polymer basis" in stderr.getvalue()
+        assert "IBOT algorithm completed successfully!" in stdout.getvalue()
+
 
 class TestIBOTAlgorithm:
     """Test IBOT algorithm."""
 
-    def test_ibot_initialization(self):
+    def test_ibot_initialization(self, initial_ibot):
         """Test IBOT algorithm initialization."""
-        tbn = create_test_tbn()
-        polymers = [np.array([1, 0, 0]), np.array([0, 1, 0]), np.array([0, 0, 1])]
-        on_target_indices = {0}
-        reactions = []
-
-        ibot = IBOTAlgorithm(tbn, polymers, on_target_indices, reactions)
+        ibot = initial_ibot
 
         # Check initial concentration exponents
         assert ibot.mu[0] == 1.0  # On-target has μ = 1
@@ -110,17 +245,12 @@ class TestIBOTAlgorithm:
         # Check unassigned tracking
         assert ibot.unassigned_off_target == {1, 2}
 
-    def test_reaction_metrics(self):
+    def test_reaction_metrics(self, initial_ibot):
         """Test reaction metrics computation."""
-        tbn = create_test_tbn()
-        polymers = [np.array([1, 0, 0]), np.array([0, 1, 0]), np.array([0, 0, 1])]
-        on_target_indices = {0}
-        reactions = []
-
-        ibot = IBOTAlgorithm(tbn, polymers, on_target_indices, reactions)
+        ibot = initial_ibot
 
         # Create a reaction: P0 -> P1 + P2
-        reaction_vec = np.array([-1, 1, 1])
+        reaction_vec = np.array([-1, 1, 1], dtype=np.int8)
         reaction = Reaction(reaction_vec)
 
         metrics = ibot.compute_reaction_metrics(reaction)
@@ -132,10 +262,9 @@ class TestIBOTAlgorithm:
         # Ratio = 1/2 = 0.5
         assert metrics.ratio == 0.5
 
-    def test_ibot_tbn_generation_with_units(self):
+    def test_ibot_tbn_generation_with_units(self, tbn, tmp_path):
         """Test .tbn generation with proper unit conversion."""
-        tbn = create_test_tbn()
-        polymers = [np.array([1, 0, 0]), np.array([0, 1, 0])]
+        polymers = [np.array([1, 0, 0], dtype=np.int8), np.array([0, 1, 0], dtype=np.int8)]
         on_target_indices = {0, 1}
         reactions = []  # No reactions for simplicity
 
@@ -145,47 +274,45 @@ class TestIBOTAlgorithm:
         concentration_exponents = ibot.run()
 
         # Test .tbn generation with unit conversion
-        with tempfile.NamedTemporaryFile(suffix=".tbn", delete=False) as f:
-            output_path = Path(f.name)
-
-        try:
-            # Generate with c=100 nM
-            ibot.generate_tbn_output(output_path, 100, "nM")
-
-            # Read and verify the file
-            content = output_path.read_text()
-            assert "\\UNITS: nM" in content
-
-            # Verify concentrations are calculated correctly
-            # c' = 100 nM = 100e-9 M = 1e-7 M
-            # Each monomer should have concentration = count * (1e-7)^1
-            # Converted back to nM = 100 nM for each monomer appearance
-            lines = content.strip().split("\n")
-            monomer_count = 0
-            for line in lines:
-                if ", " in line and not line.startswith("#"):
-                    monomer_count += 1
-                    # Extract concentration value
-                    conc_str = line.split(", ")[1]
-                    conc_val = float(conc_str)
-                    # Monomers M1 and M2 each appear once in their respective polymers with μ=1
-                    # So concentration should be 100 nM
-                    # M3 doesn't appear in any of our polymers, so should be 0
-                    if monomer_count <= 2:
-                        assert abs(conc_val - 100) < 0.01
-                    else:
-                        assert abs(conc_val) < 0.01  # M3 should be 0
-        finally:
-            output_path.unlink()
-
-    def test_ibot_with_tbnpolys_output(self):
+        output_path = tmp_path / "output.tbn"
+        # Generate with c=100 nM
+        ibot.generate_tbn_output(output_path, 100, "nM")
+
+        # Read and verify the file
+        content = output_path.read_text()
+        assert "\\UNITS: nM" in content
+
+        # Verify concentrations are calculated correctly
+        # c' = 100 nM = 100e-9 M = 1e-7 M
+        # Each monomer should have concentration = count * (1e-7)^1
+        # Converted back to nM = 100 nM for each monomer appearance
+        lines = content.strip().split("\n")
+        monomer_count = 0
+        for line in lines:
+            if ", " in line and not line.startswith("#"):
+                monomer_count += 1
+                # Extract concentration value
+                conc_str = line.split(", ")[1]
+                conc_val = float(conc_str)
+                # Monomers M1 and M2 each appear once in their respective polymers with μ=1
+                # So concentration should be 100 nM
+                # M3 doesn't appear in any of our polymers, so should be 0
+                if monomer_count <= 2:
+                    assert abs(conc_val - 100) < 0.01
+                else:
+                    assert abs(conc_val) < 0.01  # M3 should be 0
+
+    def test_ibot_with_tbnpolys_output(self, tbn, tmp_path):
         """Test IBOT output generation."""
-        tbn = create_test_tbn()
-        polymers = [np.array([1, 0, 0]), np.array([0, 1, 0]), np.array([1, 1, 0])]
+        polymers = [
+            np.array([1, 0, 0], dtype=np.int8),
+            np.array([0, 1, 0], dtype=np.int8),
+            np.array([1, 1, 0], dtype=np.int8),
+        ]
         on_target_indices = {0}
 
         # Create a simple reaction
-        reaction_vec = np.array([-1, 1, 0])
+        reaction_vec = np.array([-1, 1, 0], dtype=np.int8)
         reactions = [Reaction(reaction_vec)]
 
         ibot = IBOTAlgorithm(tbn, polymers, on_target_indices, reactions)
@@ -202,39 +329,39 @@ class TestIBOTAlgorithm:
         assert 2 not in concentration_exponents  # Unassigned, removed
 
         # Test output generation (just check it doesn't crash)
-        with tempfile.NamedTemporaryFile(suffix=".tbnpolys", delete=False) as f:
-            output_path = Path(f.name)
+        output_path = tmp_path / "output.tbnpolys"
+        ibot.generate_tbnpolys_output(output_path)
+        assert output_path.exists()
 
-        try:
-            ibot.generate_tbnpolys_output(output_path)
-            assert output_path.exists()
+        # Read and verify content
+        content = output_path.read_text()
+        assert "ON-TARGET POLYMERS" in content
+        assert "OFF-TARGET POLYMERS" in content
+        assert "# μ:" in content
 
-            # Read and verify content
-            content = output_path.read_text()
-            assert "ON-TARGET POLYMERS" in content
-            assert "OFF-TARGET POLYMERS" in content
-            assert "# μ:" in content
-        finally:
-            output_path.unlink()
 
+_AND_GATE_TBN = Path("extensions/my_inputs/and_gate.tbn")
+_AND_GATE_ON_TARGET = Path("extensions/my_inputs/and_gate_on-target.tbnpolys")
 
-class TestEndToEnd:
-    """End-to-end integration tests."""
 
-    def test_and_gate_example(self):
-        """Test with the and_gate example files."""
-        # Check if example files exist
-        tbn_file = Path("extensions/my_inputs/and_gate.tbn")
-        on_target_file = Path("extensions/my_inputs/and_gate_on-target.tbnpolys")
+@pytest.fixture(scope="module")
+def and_gate_tbn():
+    """The and_gate example TBN, parsed once per module (tests must not mutate it)."""
+    if not _AND_GATE_TBN.exists() or not _AND_GATE_ON_TARGET.exists():
+        pytest.skip("Example files not found")
+
+    monomers, binding_site_index, concentration_units, _ = TBNParser.parse_file(str(_AND_GATE_TBN))
+    return TBN(monomers, binding_site_index, concentration_units)
 
-        if not tbn_file.exists() or not on_target_file.exists():
-            pytest.skip("Example files not found")
 
-        # Parse TBN
-        monomers, binding_site_index, concentration_units, _ = TBNParser.parse_file(str(tbn_file))
-        assert concentration_units is None  # Should have no concentrations
+class TestEndToEnd:
+    """End-to-end integration tests."""
 
-        tbn = TBN(monomers, binding_site_index, concentration_units)
+    @pytest.mark.slow
+    def test_and_gate_example(self, and_gate_tbn):
+        """Test with the and_gate example files."""
+        tbn = and_gate_tbn
+        assert tbn.concentration_units is None  # Should have no concentrations
 
         # Compute polymer basis
         basis_computer = PolymerBasisComputer(tbn)
@@ -245,7 +372,7 @@ class TestEndToEnd:
 
         # Set up canonical reactions
         reactions_computer = CanonicalReactionsComputer(tbn)
-        on_target_indices = reactions_computer.load_on_target_polymers(on_target_file, polymer_vectors)
+        on_target_indices = reactions_computer.load_on_target_polymers(_AND_GATE_ON_TARGET, polymer_vectors)
 
         assert len(on_target_indices) == 4  # Based on the example file
 
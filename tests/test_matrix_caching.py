@@ -41,6 +41,9 @@ class TestMatrixHashing:
         assert hash1 == hash2
         assert len(hash1) == 64  # SHA256 produces 64 hex characters
 
+        # Repeated calls reuse the memoized hash
+        assert tbn1.compute_matrix_hash() is hash1
+
     def test_compute_matrix_hash_different_for_different_matrices(self):
         """Test that different matrices produce different hashes."""
         binding_site_index = {"a": 0, "a*": 1, "b": 2, "b*": 3}
@@ -89,17 +92,16 @@ class TestPolymerBasisCaching:
         """Create a sample .tbnpolymat file."""
         polymat_file = temp_dir / "test.tbnpolymat"
 
-        with open(polymat_file, "w") as f:
-            f.write("# TBN Polymer Matrix\n")
-            f.write("# Number of polymers: 2\n")
-            f.write("# Number of monomers: 2\n")
-            f.write(f"\\MATRIX-HASH: {matrix_hash}\n")
-            f.write("# Concentration units: nM\n")
-            f.write("# Columns: monomer_counts[1..2] free_energy concentration\n")
-            f.write("#\n")
-
-            for polymer_data in polymers_data:
-                f.write(" ".join(map(str, polymer_data)) + "\n")
+        header = f"""# TBN Polymer Matrix
+# Number of polymers: 2
+# Number of monomers: 2
+\\MATRIX-HASH: {matrix_hash}
+# Concentration units: nM
+# Columns: monomer_counts[1..2] free_energy concentration
+#
+"""
+        rows = "".join(" ".join(map(str, polymer_data)) + "\n" for polymer_data in polymers_data)
+        polymat_file.write_text(header + rows)
 
         return polymat_file
 
@@ -161,13 +163,13 @@ class TestPolymerBasisCaching:
             polymat_file = temp_path / "test.tbnpolymat"
 
             # Create a .tbnpolymat file without hash
-            with open(polymat_file, "w") as f:
-                f.write("# TBN Polymer Matrix\n")
-                f.write("# Number of polymers: 1\n")
-                f.write("# Number of monomers: 2\n")
-                f.write("# Columns: monomer_counts[1..2]\n")
-                f.write("#\n")
-                f.write("1 0\n")
+            polymat_file.write_text("""# TBN Polymer Matrix
+# Number of polymers: 1
+# Number of monomers: 2
+# Columns: monomer_counts[1..2]
+#
+1 0
+""")
 
             # Load cached polymer basis
             cached_polymers = computer.load_cached_polymer_basis(str(polymat_file))
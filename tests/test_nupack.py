@@ -23,6 +23,12 @@ def sample_polymers():
     return [polymer1, polymer2, polymer3]
 
 
+def set_free_energies(monkeypatch, polymers, energies):
+    """Make Polymer.compute_free_energy return a fixed energy for each polymer."""
+    energy_by_id = {id(polymer): energy for polymer, energy in zip(polymers, energies)}
+    monkeypatch.setattr(Polymer, "compute_free_energy", lambda polymer, *args, **kwargs: energy_by_id[id(polymer)])
+
+
 @pytest.fixture
 def sample_tbn():
     """Create a sample TBN with monomer concentrations."""
@@ -85,14 +91,13 @@ class TestNupackRunner:
         mock_access.return_value = False
         assert runner.check_nupack_available() is False
 
-    def test_write_ocx_file(self, sample_polymers, tmp_path):
+    def test_write_ocx_file(self, sample_polymers, tmp_path, monkeypatch):
         """Test writing OCX file for NUPACK."""
         runner = NupackRunner()
         ocx_path = tmp_path / "test.ocx"
 
         # Mock compute_free_energy to return predictable values
-        for i, polymer in enumerate(sample_polymers):
-            polymer.compute_free_energy = Mock(return_value=-1.5 * (i + 1))
+        set_free_energies(monkeypatch, sample_polymers, [-1.5, -3.0, -4.5])
 
         runner._write_ocx_file(sample_polymers, str(ocx_path), deltaG=[0.0, 0.0], temperature=37.0)
 
@@ -154,7 +159,7 @@ class TestNupackRunner:
             runner._parse_nupack_output(str(eq_path))
 
     @patch("subprocess.run")
-    def test_compute_equilibrium_concentrations(self, mock_run, sample_polymers, sample_tbn, tmp_path):
+    def test_compute_equilibrium_concentrations(self, mock_run, sample_polymers, sample_tbn, tmp_path, monkeypatch):
         """Test full equilibrium concentration computation."""
         runner = NupackRunner("/path/to/nupack", temperature=25.0)
 
@@ -168,8 +173,7 @@ class TestNupackRunner:
         mock_run.return_value = mock_result
 
         # Mock compute_free_energy for polymers
-        for i, polymer in enumerate(sample_polymers):
-            polymer.compute_free_energy = Mock(return_value=-1.5 * (i + 1))
+        set_free_energies(monkeypatch, sample_polymers, [-1.5, -3.0, -4.5])
 
         # Create temporary .eq file that NUPACK would generate
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -211,7 +215,9 @@ class TestNupackRunner:
             runner.compute_equilibrium_concentrations(sample_polymers, tbn)
 
     @patch("subprocess.run")
-    def test_compute_equilibrium_concentrations_nupack_failure(self, mock_run, sample_polymers, sample_tbn):
+    def test_compute_equilibrium_concentrations_nupack_failure(
+        self, mock_run, sample_polymers, sample_tbn, monkeypatch
+    ):
         """Test handling of NUPACK execution failure."""
         runner = NupackRunner("/path/to/nupack")
         runner.check_nupack_available = Mock(return_value=True)
@@ -223,8 +229,7 @@ class TestNupackRunner:
         mock_run.return_value = mock_result
 
         # Mock compute_free_energy for polymers
-        for polymer in sample_polymers:
-            polymer.compute_free_energy = Mock(return_value=-1.0)
+        set_free_energies(monkeypatch, sample_polymers, [-1.0] * len(sample_polymers))
 
         with pytest.raises(RuntimeError, match="NUPACK failed: NUPACK error: invalid input"):
             runner.compute_equilibrium_concentrations(sample_polymers, sample_tbn)
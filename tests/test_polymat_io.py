@@ -209,6 +209,31 @@ class TestPolymatWriter:
             assert data_lines[0] == "1 0 -2.5 1.50e-07"
             assert data_lines[1] == "0 2 -3.0 2.30e-08"
 
+    @pytest.mark.parametrize(
+        "column,kwargs",
+        [
+            ("free_energies", {"free_energies": np.array([-2.5]), "has_free_energies": True}),
+            (
+                "concentrations",
+                {
+                    "free_energies": np.array([-2.5, -3.0]),
+                    "concentrations": np.array([1.5e-7]),
+                    "has_free_energies": True,
+                    "has_concentrations": True,
+                },
+            ),
+        ],
+    )
+    def test_write_rejects_short_column(self, tmp_path, column, kwargs):
+        """Test that a column shorter than the polymer list raises instead of dropping rows."""
+        polymers = [np.array([1, 0]), np.array([0, 2])]
+        data = PolymatData(polymers=polymers, n_monomers=2, n_polymers=2, **kwargs)
+
+        file_path = tmp_path / "test.tbnpolymat"
+        with pytest.raises(ValueError, match=f"Expected 2 {column}"):
+            PolymatWriter(str(file_path)).write(data)
+        assert not file_path.exists()
+
 
 class TestPolymatReader:
     """Tests for PolymatReader class."""
@@ -351,6 +376,30 @@ class TestPolymatReader:
             assert fe == -2.0
             assert conc is None
 
+    def test_read_counts(self):
+        """Test reading only the monomer count columns into a matrix."""
+        content = """# TBN Polymer Matrix
+# Number of polymers: 3
+# Number of monomers: 2
+# Columns: monomer_counts[1..2] free_energy concentration
+#
+1 0 -1.0 2.5e-7
+0 1 -2.0 0.00e0
+2 2 -3.0 1.0e-9
+"""
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = self.create_test_file(tmpdir, content)
+
+            counts = PolymatReader(file_path).read_counts(dtype=np.int32)
+            assert counts.dtype == np.int32
+            np.testing.assert_array_equal(counts, [[1, 0], [0, 1], [2, 2]])
+
+            # Non-numeric counts are an error
+            bad_path = self.create_test_file(tmpdir, "# Number of monomers: 2\n1 x -1.0\n")
+            with pytest.raises(ValueError):
+                PolymatReader(bad_path).read_counts()
+
     def test_file_not_found(self):
         """Test error handling for non-existent file."""
         with pytest.raises(FileNotFoundError):
@@ -55,6 +55,9 @@ class TestPolymer:
         assert polymer1 != polymer3
         assert polymer1 != "not a polymer"
 
+        # Equality does not depend on the integer dtype of the counts
+        assert polymer1 == Polymer(np.array([1, 2, 0], dtype=np.int16), monomers)
+
     def test_get_monomers_with_counts(self):
         """Test get_monomers_with_counts method."""
         # Create mock monomers with names
@@ -104,6 +107,9 @@ class TestPolymer:
         polymer_set = {polymer1, polymer2, polymer3}
         assert len(polymer_set) == 2  # polymer1 and polymer2 are the same
 
+        # Hashes agree with equality across integer dtypes
+        assert hash(Polymer(np.array([1, 2, 0], dtype=np.int32), monomers)) == hash(polymer1)
+
 
 class TestPolymerBasisComputer:
     def test_init_with_normaliz(self):
@@ -153,6 +159,85 @@ class TestPolymerBasisComputer:
         np.testing.assert_array_equal(polymers[1].monomer_counts, [0, 1, 1])
         np.testing.assert_array_equal(polymers[2].monomer_counts, [1, 1, 0])
 
+    def test_compute_polymer_basis_removes_duplicates(self):
+        """Test that duplicate Hilbert basis vectors are dropped, keeping first-occurrence order."""
+        mock_normaliz = Mock()
+        # The last column belongs to a fake singleton monomer and is truncated away
+        mock_normaliz.compute_hilbert_basis.return_value = [
+            np.array([0, 2, 1, 0]),
+            np.array([1, 0, 1, 0]),
+            np.array([0, 2, 1, 1]),
+            np.array([1, 1, 0, 0]),
+            np.array([1, 0, 1, 0]),
+        ]
+
+        tbn = Mock(spec=TBN)
+        tbn.monomers = [Mock(spec=Monomer) for _ in range(3)]
+        tbn.get_augmented_matrix_for_polymer_basis.return_value = (np.array([[1, 0, -1, 1]]), 3)
+
+        computer = PolymerBasisComputer(tbn, normaliz_runner=mock_normaliz)
+        polymers = computer.compute_polymer_basis()
+
+        assert [p.monomer_counts.tolist() for p in polymers] == [[0, 2, 1], [1, 0, 1], [1, 1, 0]]
+        assert all(p.monomer_counts.flags["C_CONTIGUOUS"] for p in polymers)
+        # Polymers are row views into one shared count matrix, not separate arrays
+        assert all(p.monomer_counts.base is polymers[0].monomer_counts.base for p in polymers)
+        assert polymers[0].monomer_counts.base is not None
+
+    def test_compute_polymer_basis_uses_basis_cache(self, tmp_path):
+        """Test that a memoized basis is reused for the same matrix hash."""
+        mock_normaliz = Mock()
+        mock_normaliz.compute_hilbert_basis.return_value = [np.array([1, 0, 1]), np.array([0, 1, 1])]
+
+        tbn = Mock(spec=TBN)
+        tbn.monomers = [Mock(spec=Monomer) for _ in range(3)]
+        tbn.compute_matrix_hash.return_value = "abc123"
+        tbn.get_augmented_matrix_for_polymer_basis.return_value = (np.array([[1, 0, -1], [0, 1, -1]]), 3)
+
+        cache_dir = tmp_path / "basis-cache"
+        computer = PolymerBasisComputer(tbn, normaliz_runner=mock_normaliz, basis_cache_dir=str(cache_dir))
+        polymers = computer.compute_polymer_basis()
+        assert (cache_dir / "polybasis_abc123.npz").exists()
+
+        cached = PolymerBasisComputer(tbn, normaliz_runner=mock_normaliz, basis_cache_dir=str(cache_dir))
+        assert cached.compute_polymer_basis() == polymers
+        assert mock_normaliz.compute_hilbert_basis.call_count == 1
+
+        # A different matrix hash misses the cache
+        tbn.compute_matrix_hash.return_value = "def456"
+        cached.compute_polymer_basis()
+        assert mock_normaliz.compute_hilbert_basis.call_count == 2
+
+    @pytest.mark.parametrize("truncate", [True, False])
+    def test_compute_polymer_basis_recovers_from_corrupt_basis_cache(self, tmp_path, truncate):
+        """Test that a truncated or garbage basis cache is recomputed and rewritten."""
+        mock_normaliz = Mock()
+        mock_normaliz.compute_hilbert_basis.return_value = [np.array([1, 0, 1]), np.array([0, 1, 1])]
+
+        tbn = Mock(spec=TBN)
+        tbn.monomers = [Mock(spec=Monomer) for _ in range(3)]
+        tbn.compute_matrix_hash.return_value = "abc123"
+        tbn.get_augmented_matrix_for_polymer_basis.return_value = (np.array([[1, 0, -1], [0, 1, -1]]), 3)
+
+        cache_dir = tmp_path / "basis-cache"
+        cache_path = cache_dir / "polybasis_abc123.npz"
+        computer = PolymerBasisComputer(tbn, normaliz_runner=mock_normaliz, basis_cache_dir=str(cache_dir))
+        polymers = computer.compute_polymer_basis()
+        valid_cache = cache_path.read_bytes()
+
+        # Simulate an interrupted write or an unrelated file at the cache path
+        cache_path.write_bytes(valid_cache[: len(valid_cache) // 2] if truncate else b"not an npz archive")
+
+        recomputed = PolymerBasisComputer(tbn, normaliz_runner=mock_normaliz, basis_cache_dir=str(cache_dir))
+        assert recomputed.compute_polymer_basis() == polymers
+        assert mock_normaliz.compute_hilbert_basis.call_count == 2
+
+        # The cache was rewritten with a valid archive, leaving no temporary files behind
+        assert [p.name for p in cache_dir.iterdir()] == ["polybasis_abc123.npz"]
+        reloaded = PolymerBasisComputer(tbn, normaliz_runner=mock_normaliz, basis_cache_dir=str(cache_dir))
+        assert reloaded.compute_polymer_basis() == polymers
+        assert mock_normaliz.compute_hilbert_basis.call_count == 2
+
     def test_compute_polymer_basis_with_fourtitwo(self):
         """Test compute_polymer_basis using 4ti2."""
         mock_fourtitwo = Mock()
@@ -486,6 +571,27 @@ class TestPolymerBasisComputer:
         finally:
             Path(output_file).unlink()
 
+    def test_save_tbnpolymat_free_energies_with_deltaG(self, tmp_path):
+        """Test that batched free energies in save_tbnpolymat match Polymer.compute_free_energy."""
+        tbn = Mock(spec=TBN)
+        tbn.compute_matrix_hash.return_value = "test_hash"
+        tbn.concentrations = None
+        tbn.concentration_units = None
+        tbn.monomers = [Mock(spec=Monomer) for _ in range(2)]
+
+        computer = PolymerBasisComputer(tbn)
+        polymers = [Polymer(np.array(counts), tbn.monomers, tbn) for counts in ([1, 0], [1, 1], [2, 3])]
+        deltaG = [1.96, 0.2]
+
+        output_file = tmp_path / "test.tbnpolymat"
+        computer.save_tbnpolymat(polymers, str(output_file), deltaG=deltaG, temperature=25.0)
+
+        data_lines = [
+            line for line in output_file.read_text().splitlines() if line and not line.startswith(("#", "\\"))
+        ]
+        energies = [float(line.split()[-1]) for line in data_lines]
+        assert energies == [polymer.compute_free_energy(deltaG, 25.0) for polymer in polymers]
+
     def test_save_tbnpolymat_no_concentrations(self):
         """Test save_tbnpolymat without monomer concentrations."""
         # Create mock TBN without concentrations
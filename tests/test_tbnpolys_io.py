@@ -3,6 +3,7 @@
 import tempfile
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from tbnexplorer2.model import TBN, BindingSite, Monomer
@@ -88,6 +89,19 @@ class TestTbnpolysWriter:
         empty_line_count = sum(1 for line in lines if line.strip() == "")
         assert empty_line_count >= 1
 
+    def test_write_count_matrix(self):
+        """Test that count matrices and count arrays format the same as lists of counts."""
+        tbn = create_test_tbn()
+        writer = TbnpolysWriter(tbn)
+
+        polymers = [[1, 0, 1], [0, 0, 0], [0, 2, 3]]
+
+        content = writer.format_polymers(np.array(polymers))
+
+        assert content == writer.format_polymers(polymers)
+        assert content == writer.format_polymers([np.array(polymer) for polymer in polymers])
+        assert "3 | C" in content
+
     def test_write_with_concentrations(self):
         """Test writing polymers with concentrations."""
         tbn = create_test_tbn()
@@ -132,6 +146,8 @@ class TestTbnpolysWriter:
             (155.5, "155.5"),  # >= 100 uses 1 decimal place
             (555.5, "555.5"),  # >= 100 uses 1 decimal place
             (5555.5, "5.6e+03"),  # >= 1000 uses scientific notation
+            (1, "1.000"),  # Thresholds belong to the range above them
+            (1000, "1.0e+03"),
         ]
 
         for value, expected_prefix in test_cases:
@@ -282,6 +298,10 @@ monomer1: a b c
         with pytest.raises(ValueError, match="binding sites don't match"):
             parser.parse_content(content)
 
+        # Binding sites are compared as multisets: C has two copies of site c
+        with pytest.raises(ValueError, match="binding sites don't match"):
+            parser.parse_content("C: c\n")
+
     def test_resolve_monomer_with_unknown_name(self):
         """Test that unknown monomer names raise an error."""
         tbn = create_test_tbn()